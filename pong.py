@@ -1,13 +1,147 @@
+import argparse
 import sys
+from src.botprotocol import connect
+from src.bots import BotController
+from src.diagnostics import FrameDiagnostics, GCController
+from src.display import Display
 from src.game import Game
+from src.livestate import LiveStateWriter
+from src.replay import MatchRecorder
+from src.telemetry import MatchTelemetry, TelemetryWriter
+from src.threaded import ThreadedRunner
+
+
+def window_size(text):
+    """Parse a WxH window size"""
+    try:
+        width, height = (int(n) for n in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WxH, got {text!r}")
+    return width, height
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Play Pong against an AI opponent")
+    parser.add_argument(
+        "--multiball",
+        type=int,
+        default=0,
+        metavar="N",
+        help="multi-ball chaos mode with N balls",
+    )
+    parser.add_argument(
+        "--ball-collisions",
+        action="store_true",
+        help="let balls bounce off each other in multi-ball mode",
+    )
+    parser.add_argument(
+        "--telemetry",
+        metavar="PATH",
+        help="record match and rally telemetry to an SQLite database",
+    )
+    parser.add_argument(
+        "--diagnostics",
+        action="store_true",
+        help="report per-frame allocations and GC pauses on exit",
+    )
+    parser.add_argument(
+        "--gc-freeze",
+        action="store_true",
+        help="freeze startup objects and only collect garbage outside gameplay",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        help="save a replay of every match to DIR (see scripts/export_video.py)",
+    )
+    parser.add_argument(
+        "--ai-vs-ai",
+        action="store_true",
+        help="let a second AI play the left paddle",
+    )
+    parser.add_argument(
+        "--bot",
+        metavar="ADDRESS",
+        help="let the bot listening on ADDRESS (socket path or host:port) "
+        "play the right paddle",
+    )
+    parser.add_argument(
+        "--bot-left",
+        action="store_true",
+        help="let the bot play the left paddle too (implies --ai-vs-ai)",
+    )
+    parser.add_argument(
+        "--bot-deadline",
+        type=float,
+        metavar="MS",
+        help="real-time mode: the built-in AI moves when the bot has not replied "
+        "within MS milliseconds (default: wait for every reply)",
+    )
+    parser.add_argument(
+        "--live-state",
+        metavar="NAME",
+        help="publish live game state to the shared memory block NAME",
+    )
+    parser.add_argument(
+        "--window",
+        type=window_size,
+        metavar="WxH",
+        help="initial window size, e.g. 1600x1200 (the window is resizable)",
+    )
+    parser.add_argument(
+        "--fullscreen",
+        action="store_true",
+        help="play fullscreen at the desktop resolution",
+    )
+    parser.add_argument(
+        "--low-res",
+        action="store_true",
+        help="fullscreen at half the desktop resolution, for weak hardware "
+        "on high-resolution screens (implies --fullscreen)",
+    )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="simulate on a worker thread at a fixed rate, apart from rendering",
+    )
+    return parser.parse_args()
 
 
 def main():
-    game = Game()
-    game.run()
+    args = parse_args()
+    display = Display(args.window, args.fullscreen or args.low_res, args.low_res)
+    writer = TelemetryWriter(args.telemetry) if args.telemetry else None
+    game = Game(
+        multiball=args.multiball,
+        ball_collisions=args.ball_collisions,
+        telemetry=MatchTelemetry(writer) if writer else None,
+        diagnostics=FrameDiagnostics() if args.diagnostics else None,
+        gc_controller=GCController() if args.gc_freeze else None,
+        recorder=MatchRecorder(args.record) if args.record else None,
+        ai_vs_ai=args.ai_vs_ai or (args.bot is not None and args.bot_left),
+        display=display,
+    )
+    bots = None
+    if args.bot:
+        deadline = args.bot_deadline / 1000 if args.bot_deadline is not None else None
+        bots = BotController(connect(args.bot), deadline)
+        bots.attach(game, left=args.bot_left)
+        bots.subscribe(game.events)
+    live_state = LiveStateWriter(args.live_state) if args.live_state else None
+    if live_state:
+        live_state.subscribe(game.events, game)
+    if args.threaded:
+        ThreadedRunner(game).run()
+    else:
+        game.run()
+    if writer:
+        writer.close()
+    if live_state:
+        live_state.close()
+    if bots:
+        bots.close()
     sys.exit()
 
 
 if __name__ == "__main__":
     main()
-
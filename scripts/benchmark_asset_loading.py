@@ -0,0 +1,44 @@
+"""Compare sound loading time from the asset bundle and from loose WAV files
+
+Build the bundle first with: python scripts/build_asset_bundle.py
+"""
+
+import os
+import sys
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_asset_loading.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.assets import BUNDLE_NAME, assets_dir  # noqa: E402
+from src.sounds import SoundManager  # noqa: E402
+
+RUNS = 200
+
+
+def time_loading(use_bundle):
+    """Return mean milliseconds to construct a SoundManager"""
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        SoundManager(use_bundle=use_bundle)
+    return (time.perf_counter() - start) / RUNS * 1000
+
+
+def main():
+    if not os.path.exists(os.path.join(assets_dir(), BUNDLE_NAME)):
+        raise SystemExit("No asset bundle; run scripts/build_asset_bundle.py first")
+    # Construct once so mixer initialization is not part of the timing
+    SoundManager()
+    loose = time_loading(use_bundle=False)
+    bundled = time_loading(use_bundle=True)
+    print(f"loose WAV files: {loose:.3f} ms")
+    print(f"asset bundle:    {bundled:.3f} ms ({loose / bundled:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Measure the cost of driving paddles from an external bot process
+
+Starts scripts/example_bot.py on a Unix socket and times ticks of headless
+AI-vs-AI games whose paddles it plays. Lockstep runs with one match and with
+a batch of matches per message show the round-trip cost per tick and how far
+batching amortizes it; real-time runs show the deadline keeping ticks short
+when the bot is too slow, and how often the built-in AI had to step in.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_bots.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.botprotocol import connect  # noqa: E402
+from src.bots import BotController  # noqa: E402
+from src.game import Game  # noqa: E402
+
+TICKS = 2000
+REALTIME_TICKS = 300
+# (matches per message, deadline in ms or None for lockstep, bot delay in ms)
+RUNS = [
+    (1, None, 0),
+    (16, None, 0),
+    (64, None, 0),
+    (1, 2.0, 0),
+    (1, 2.0, 5),
+]
+
+
+def new_game():
+    game = Game(ai_vs_ai=True)
+    game.max_score = 1000
+    game.start_match()
+    return game
+
+
+def time_plain(matches):
+    """Return microseconds per match tick without a bot"""
+    games = [new_game() for _ in range(matches)]
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        for game in games:
+            game.update()
+    return (time.perf_counter() - start) / (TICKS * matches) * 1e6
+
+
+def time_bot(address, matches, deadline, delay):
+    """Return (us per match tick, 99th percentile tick in ms, AI fallbacks,
+    late replies)"""
+    bot = subprocess.Popen(
+        [
+            sys.executable,
+            os.path.join(script_dir, "example_bot.py"),
+            address,
+            "--delay",
+            str(delay),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    while True:
+        line = bot.stdout.readline()
+        if line.startswith("Waiting"):
+            break
+        if line == "" or bot.poll() is not None:
+            raise SystemExit(f"Bot exited with code {bot.wait()} before listening")
+    controller = BotController(
+        connect(address), deadline / 1000 if deadline is not None else None
+    )
+    games = [new_game() for _ in range(matches)]
+    for game in games:
+        controller.attach(game, left=True, right=True)
+    ticks = TICKS if delay == 0 else REALTIME_TICKS
+    tick_times = []
+    start = time.perf_counter()
+    for _ in range(ticks):
+        tick_start = time.perf_counter()
+        controller.step()
+        for game in games:
+            game.update()
+        tick_times.append(time.perf_counter() - tick_start)
+    elapsed = time.perf_counter() - start
+    controller.close()
+    bot.wait()
+    tick_times.sort()
+    fallbacks = sum(paddle.fallbacks for paddle in controller.paddles.values())
+    return (
+        elapsed / (ticks * matches) * 1e6,
+        tick_times[len(tick_times) * 99 // 100] * 1e3,
+        fallbacks,
+        controller.late,
+    )
+
+
+def main():
+    address = os.path.join(tempfile.mkdtemp(), "bot.sock")
+    print(
+        f"{'matches':>7} {'mode':<14} {'delay':>5} {'us/tick':>8} "
+        f"{'no bot':>7} {'p99 ms':>8} {'fallbacks':>9} {'late':>5}"
+    )
+    for matches, deadline, delay in RUNS:
+        per_tick, p99, fallbacks, late = time_bot(address, matches, deadline, delay)
+        mode = "lockstep" if deadline is None else f"deadline {deadline:g}ms"
+        print(
+            f"{matches:>7} {mode:<14} {delay:>5} {per_tick:>8.1f} "
+            f"{time_plain(matches):>7.1f} {p99:>8.2f} {fallbacks:>9} {late:>5}"
+        )
+    os.unlink(address)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Measure scaling the logical frame to different window sizes
+
+Plays headless AI-vs-AI frames (update + render + present) through Display
+at several window sizes, presenting either only the dirty regions or the
+full frame every time. 1920x1080 is also what --low-res feeds a 4K screen.
+Afterwards the dirty-region window is compared with a full-frame present of
+the same frame; stale pixels left behind by a missed region abort with an
+error.
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_display.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+import pygame  # noqa: E402
+from src.display import Display  # noqa: E402
+from src.game import Game  # noqa: E402
+
+FRAMES = 600
+WINDOW_SIZES = [(800, 600), (1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+
+
+def new_game(display):
+    game = Game(ai_vs_ai=True, display=display)
+    game.max_score = 1000
+    random.seed(1)
+    game.ball.reset()
+    game.start_match()
+    return game
+
+
+def time_frames(game, full):
+    """Return mean milliseconds per frame"""
+    display = game.display
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        game.update()
+        game.render()
+        display.present(None if full else game.dirty_rects())
+    return (time.perf_counter() - start) / FRAMES * 1e3
+
+
+def stale_pixels(game):
+    """Return how many window pixels a full present shows differently
+
+    Scaling a region on its own may sample a neighbouring logical pixel
+    instead, so a pixel only counts when nothing within one logical pixel of
+    it in the full present matches.
+    """
+    display = game.display
+    window = display.window
+    width, height = window.get_size()
+    dirty = pygame.image.tobytes(window, "RGB")
+    display.present(None)
+    full = pygame.image.tobytes(window, "RGB")
+    row = width * 3
+    reach = math.ceil(display.scale)
+    stale = 0
+    for y in range(height):
+        start = y * row
+        if dirty[start : start + row] == full[start : start + row]:
+            continue
+        for x in range(width):
+            i = start + x * 3
+            pixel = dirty[i : i + 3]
+            if pixel == full[i : i + 3]:
+                continue
+            neighbours = (
+                full[j : j + 3]
+                for ny in range(max(y - reach, 0), min(y + reach + 1, height))
+                for nx in range(max(x - reach, 0), min(x + reach + 1, width))
+                for j in (ny * row + nx * 3,)
+            )
+            if pixel not in neighbours:
+                stale += 1
+    return stale
+
+
+def main():
+    print(f"{'window':>10} {'dirty ms':>9} {'full ms':>8}")
+    for size in WINDOW_SIZES:
+        game = new_game(Display(size))
+        dirty = time_frames(game, False)
+        stale = stale_pixels(game)
+        if stale:
+            raise SystemExit(f"Dirty-region presents left {stale} pixels stale")
+        full = time_frames(game, True)
+        print(f"{size[0]:>5}x{size[1]:<4} {dirty:>9.2f} {full:>8.2f}")
+    print("No stale pixels after dirty-region presents")
+
+
+if __name__ == "__main__":
+    main()
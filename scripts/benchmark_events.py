@@ -0,0 +1,77 @@
+"""Measure the hot-path overhead of the game event hooks
+
+First times a single dispatch with no, one and four subscribers, next to an
+empty loop for reference, then times Game.update with no subscribers at all,
+with the default ones (sound and effects) and with an extra no-op handler on
+every event.
+"""
+
+import os
+import sys
+import time
+import timeit
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_events.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.events import EVENTS, GameEvents  # noqa: E402
+from src.game import Game  # noqa: E402
+
+DISPATCHES = 1_000_000
+TICKS = 20000
+
+
+def noop(*args):
+    pass
+
+
+def time_dispatch(subscribers):
+    """Return nanoseconds per wall_hit dispatch with ``subscribers`` no-ops"""
+    events = GameEvents()
+    for _ in range(subscribers):
+        events.subscribe("wall_hit", noop)
+    seconds = timeit.timeit(
+        "for handler in events.wall_hit: handler(1, 2)",
+        globals={"events": events},
+        number=DISPATCHES,
+    )
+    return seconds / DISPATCHES * 1e9
+
+
+def time_ticks(game):
+    """Return mean microseconds per Game.update"""
+    game.max_score = None
+    game.start_match()
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        game.player_paddle.set_position(game.ball.rect.centery)
+        game.update()
+    return (time.perf_counter() - start) / TICKS * 1e6
+
+
+def main():
+    baseline = timeit.timeit("pass", number=DISPATCHES) / DISPATCHES * 1e9
+    print(f"{'dispatch':<22} {'ns':>8}")
+    print(f"{'empty statement':<22} {baseline:>8.1f}")
+    for subscribers in (0, 1, 4):
+        print(f"{f'{subscribers} subscribers':<22} {time_dispatch(subscribers):>8.1f}")
+
+    print()
+    print(f"{'Game.update':<22} {'us/tick':>8}")
+    bare = Game()
+    bare.events = GameEvents()
+    print(f"{'no subscribers':<22} {time_ticks(bare):>8.2f}")
+    print(f"{'sound + effects':<22} {time_ticks(Game()):>8.2f}")
+    extra = Game()
+    for event in EVENTS:
+        extra.events.subscribe(event, noop)
+    print(f"{'+ no-op on every event':<22} {time_ticks(extra):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Check fast-forward simulation against Game.update and time both
+
+Plays headless AI-vs-AI matches twice from the same seed, once with
+tick-by-tick Game.update and once with FastForward, across speeds and
+difficulties. Every CHECK_EVERY ticks the ball, both paddles, the scores and
+the random generator state must be identical, as must the sequence of wall
+hits, paddle hits and goals; any difference aborts with an error. Then the
+time per simulated tick of both is printed.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_fast_forward.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.fastforward import FastForward  # noqa: E402
+from src.game import Game  # noqa: E402
+
+TICKS = 50000
+CHECK_EVERY = 997
+MAX_SCORE = 1000
+CONFIGS = [
+    (1.0, "medium"),
+    (0.7, "easy"),
+    (1.3, "hard"),
+    (2.5, "medium"),
+    (3.0, "hard"),
+]
+SEEDS = (1, 2, 3)
+
+
+def new_game(seed, speed, difficulty):
+    """Return an AI-vs-AI game with a seeded, started match"""
+    game = Game(ai_vs_ai=True)
+    game.set_speed(speed)
+    game.set_ai_difficulty(difficulty)
+    game.max_score = MAX_SCORE
+    random.seed(seed)
+    game.ball.reset()
+    game.start_match()
+    events = []
+    for event in ("wall_hit", "paddle_hit", "goal", "game_over"):
+        game.events.subscribe(event, lambda *args, event=event: events.append(args))
+    return game, events
+
+
+def state(game):
+    ball = game.ball
+    return (
+        ball.rect.topleft,
+        ball.velocity_x,
+        ball.velocity_y,
+        game.player_paddle.rect.y,
+        game.ai_paddle.rect.y,
+        game.player_score,
+        game.ai_score,
+        game.game_over,
+        random.getstate(),
+    )
+
+
+def run(seed, speed, difficulty, fast):
+    """Return (states every CHECK_EVERY ticks, events, seconds, skipped ticks)"""
+    game, events = new_game(seed, speed, difficulty)
+    forward = FastForward(game)
+    states = []
+    elapsed = 0.0
+    for _ in range(TICKS // CHECK_EVERY):
+        start = time.perf_counter()
+        if fast:
+            forward.advance(CHECK_EVERY)
+        else:
+            for _ in range(CHECK_EVERY):
+                if game.game_over:
+                    break
+                game.update()
+        elapsed += time.perf_counter() - start
+        states.append(state(game))
+    return states, events, elapsed, forward.skipped
+
+
+def main():
+    print(
+        f"{'speed':>5} {'difficulty':<10} {'seed':>4} {'goals':>6} "
+        f"{'skipped':>8} {'tick us':>8} {'fast us':>8} {'speedup':>8}"
+    )
+    for speed, difficulty in CONFIGS:
+        for seed in SEEDS:
+            states, events, slow, _ = run(seed, speed, difficulty, False)
+            fast_states, fast_events, fast, skipped = run(
+                seed, speed, difficulty, True
+            )
+            for check, (expected, actual) in enumerate(zip(states, fast_states)):
+                if expected != actual:
+                    raise SystemExit(
+                        f"Mismatch at tick {(check + 1) * CHECK_EVERY} "
+                        f"(speed {speed}, {difficulty}, seed {seed}):\n"
+                        f"  Game.update: {expected[:-1]}\n"
+                        f"  FastForward: {actual[:-1]}"
+                    )
+            if events != fast_events:
+                raise SystemExit(
+                    f"Event sequences differ (speed {speed}, {difficulty}, seed {seed})"
+                )
+            goals = states[-1][5] + states[-1][6]
+            print(
+                f"{speed:>5} {difficulty:<10} {seed:>4} {goals:>6} "
+                f"{skipped / TICKS:>7.0%} {slow / TICKS * 1e6:>8.2f} "
+                f"{fast / TICKS * 1e6:>8.2f} {slow / fast:>7.1f}x"
+            )
+    print("Fast-forward matched Game.update in every run")
+
+
+if __name__ == "__main__":
+    main()
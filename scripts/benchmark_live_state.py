@@ -0,0 +1,153 @@
+"""Measure what publishing live state costs the game, and check the seqlock
+
+Times LiveStateWriter.publish on its own and Game.update with and without a
+subscribed writer. Then a separate reader process (this script with
+``--read``) polls the block as fast as it can while the writer publishes
+states whose fields all derive from the tick number; a read that mixes two
+states aborts with an error.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_live_state.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.game import Game  # noqa: E402
+from src.livestate import LiveStateReader, LiveStateWriter  # noqa: E402
+
+NAME = "pong_live_state_benchmark"
+TICKS = 20000
+PUBLISHES = 200000
+CHECK_SECONDS = 2.0
+
+
+def time_ticks(game):
+    """Return mean microseconds per Game.update"""
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        game.update()
+    return (time.perf_counter() - start) / TICKS * 1e6
+
+
+def new_game():
+    game = Game()
+    game.max_score = TICKS
+    game.start_match()
+    return game
+
+
+def fake_game(tick):
+    """Return an object shaped like Game whose fields all encode ``tick``"""
+    n = tick % 100000
+    return SimpleNamespace(
+        ball=SimpleNamespace(
+            rect=SimpleNamespace(x=n, y=-n), velocity_x=n / 2, velocity_y=-n / 2
+        ),
+        player_paddle=SimpleNamespace(rect=SimpleNamespace(y=n + 1)),
+        ai_paddle=SimpleNamespace(rect=SimpleNamespace(y=n + 2)),
+        player_score=n + 3,
+        ai_score=n + 4,
+        paused=n & 1,
+        game_over=(n >> 1) & 1,
+        game_started=1,
+        ball_store=None,
+    )
+
+
+def consistent(state):
+    n = state.ball_x
+    return state == (
+        state.tick,
+        n,
+        -n,
+        n / 2,
+        -n / 2,
+        n + 1,
+        n + 2,
+        n + 3,
+        n + 4,
+        n & 1,
+        (n >> 1) & 1,
+        1,
+        1,
+    ) and n == state.tick % 100000
+
+
+def poll(name):
+    """Read ``name`` until stdin closes, then print reads and torn reads"""
+    reader = LiveStateReader(name)
+    stop = []
+    # Closing stdin is the stop signal
+    threading.Thread(target=lambda: stop.append(sys.stdin.read())).start()
+    print("ready", flush=True)
+    reads = torn = 0
+    while not stop:
+        state = reader.read()
+        if state is None:
+            continue
+        reads += 1
+        if not consistent(state):
+            torn += 1
+    reader.close()
+    print(reads, torn)
+
+
+def main():
+    writer = LiveStateWriter(NAME)
+    try:
+        game = fake_game(1)
+        start = time.perf_counter()
+        for _ in range(PUBLISHES):
+            writer.publish(game)
+        publish = (time.perf_counter() - start) / PUBLISHES * 1e6
+
+        plain = time_ticks(new_game())
+        game = new_game()
+        writer.subscribe(game.events, game)
+        published = time_ticks(game)
+        print(f"publish:                   {publish:.2f} us")
+        print(f"Game.update without state: {plain:.2f} us")
+        print(f"Game.update with state:    {published:.2f} us")
+
+        writer.tick = 0
+        writer.publish(fake_game(0))
+        reader = subprocess.Popen(
+            [sys.executable, __file__, "--read", NAME],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        while reader.stdout.readline().strip() != "ready":
+            pass
+        writes = 0
+        end = time.perf_counter() + CHECK_SECONDS
+        while time.perf_counter() < end:
+            for _ in range(1000):
+                writes += 1
+                writer.tick = writes
+                writer.publish(fake_game(writes))
+        output = reader.communicate("")[0]
+        reads, torn = map(int, output.split())
+        print(f"{writes} writes, {reads} reads in another process")
+        if torn:
+            raise SystemExit(f"{torn} reads returned a mix of two states")
+        print("Every read was consistent")
+    finally:
+        writer.close()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--read"]:
+        poll(sys.argv[2])
+    else:
+        main()
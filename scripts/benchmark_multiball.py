@@ -0,0 +1,42 @@
+"""Benchmark multi-ball tick time as the number of balls grows"""
+import os
+import sys
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_multiball.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.game import Game  # noqa: E402
+
+BALL_COUNTS = [1, 10, 50, 100, 250, 500, 1000]
+TICKS = 300
+
+
+def time_ticks(game, ticks):
+    """Return mean seconds per Game.update over ``ticks`` ticks"""
+    game.game_started = True
+    start = time.perf_counter()
+    for _ in range(ticks):
+        game.update()
+    return (time.perf_counter() - start) / ticks
+
+
+def main():
+    print(f"{'balls':>6} {'collisions':>10} {'us/tick':>10} {'us/ball':>9}")
+    for ball_collisions in (False, True):
+        for count in BALL_COUNTS:
+            game = Game(multiball=count, ball_collisions=ball_collisions)
+            per_tick = time_ticks(game, TICKS)
+            print(
+                f"{count:>6} {str(ball_collisions):>10} "
+                f"{per_tick * 1e6:>10.1f} {per_tick * 1e6 / count:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
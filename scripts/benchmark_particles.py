@@ -0,0 +1,41 @@
+"""Benchmark particle update and draw cost up to and past pool saturation"""
+import os
+import sys
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_particles.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+import pygame  # noqa: E402
+from src.constants import WINDOW_WIDTH, WINDOW_HEIGHT  # noqa: E402
+from src.particles import ParticleSystem  # noqa: E402
+
+# Goal bursts requested per frame; the last rows ask for far more than fit
+BURSTS_PER_FRAME = [0, 1, 2, 4, 8, 16, 64]
+FRAMES = 200
+
+
+def main():
+    surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    print(f"{'bursts/frame':>12} {'live':>6} {'us/frame':>10}")
+    for bursts in BURSTS_PER_FRAME:
+        particles = ParticleSystem()
+        elapsed = 0.0
+        for _ in range(FRAMES):
+            for _ in range(bursts):
+                particles.spawn_goal(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+            start = time.perf_counter()
+            particles.update()
+            particles.draw(surface)
+            elapsed += time.perf_counter() - start
+        print(f"{bursts:>12} {particles.count:>6} {elapsed / FRAMES * 1e6:>10.1f}")
+    print(f"pool capacity: {particles.capacity}")
+
+
+if __name__ == "__main__":
+    main()
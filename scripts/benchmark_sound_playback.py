@@ -0,0 +1,62 @@
+"""Measure the cost of playing one sound effect event
+
+Compares playing the unpanned sound (how effects played before panning),
+SoundManager's pre-rendered panned variants, and panning at play time through
+Channel.set_volume for reference. All channels are stopped after every play so
+that each one finds a free channel; the cost of stopping is measured on its
+own and subtracted.
+"""
+
+import os
+import sys
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_sound_playback.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+import pygame  # noqa: E402
+import src.constants  # noqa: E402,F401  (initializes pygame and the mixer)
+from src.sounds import PAN_GAINS, PAN_STEPS, SoundManager  # noqa: E402
+
+EVENTS = 20000
+PANS = [step / 10 - 1 for step in range(21)]
+
+
+def time_events(play):
+    """Return mean microseconds per call of ``play(pan)`` plus a mixer stop"""
+    stop = pygame.mixer.stop
+    start = time.perf_counter()
+    for i in range(EVENTS):
+        play(PANS[i % len(PANS)])
+        stop()
+    return (time.perf_counter() - start) / EVENTS * 1e6
+
+
+def main():
+    sounds = SoundManager()
+    center = sounds.sounds["wall_hit"]
+
+    def play_at_volume(pan):
+        step = int((pan + 1) * (PAN_STEPS - 1) / 2 + 0.5)
+        channel = center.play()
+        if channel is not None:
+            channel.set_volume(*PAN_GAINS[step])
+
+    baseline = time_events(lambda pan: None)
+    modes = [
+        ("unpanned Sound.play", lambda pan: center.play()),
+        ("panned variant", sounds.play_wall_hit),
+        ("Channel.set_volume", play_at_volume),
+    ]
+    print(f"{'mode':<22} {'us/event':>9}")
+    for name, play in modes:
+        print(f"{name:<22} {time_events(play) - baseline:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Show that telemetry writer stalls never reach frame time
+
+Runs headless AI-vs-mouse frames (update + draw) three ways: without
+telemetry, with telemetry, and with telemetry whose writer sleeps for a long
+time on every batch (a stand-in for a slow or locked disk). Frame time
+percentiles should match across all three.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_telemetry.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.game import Game  # noqa: E402
+from src.telemetry import MatchTelemetry, TelemetryWriter, summarize  # noqa: E402
+
+FRAMES = 3000
+WRITER_STALL = 0.25  # Seconds the stalled writer sleeps per batch
+
+
+class StalledWriter(TelemetryWriter):
+    """Writer that blocks for WRITER_STALL seconds on every batch"""
+
+    def _write_batch(self, connection, batch):
+        time.sleep(WRITER_STALL)
+        super()._write_batch(connection, batch)
+
+
+def run_frames(telemetry):
+    """Return sorted per-frame times in milliseconds"""
+    game = Game(telemetry=telemetry)
+    game.max_score = 1000
+    game.start_match()
+    # Park the player paddle on the ball's path so rallies produce hits
+    times = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        game.player_paddle.set_position(game.ball.rect.centery)
+        game.update()
+        game.draw()
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    print(f"{'mode':<18} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'events':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        modes = [
+            ("no telemetry", None),
+            ("telemetry", TelemetryWriter(os.path.join(tmp, "a.db"), 0.05)),
+            ("stalled writer", StalledWriter(os.path.join(tmp, "b.db"), 0.05)),
+        ]
+        for name, writer in modes:
+            times = run_frames(MatchTelemetry(writer) if writer else None)
+            events = 0
+            if writer:
+                writer.close()
+                events = writer.written
+                summarize(writer.path)
+            print(
+                f"{name:<18} {percentile(times, 0.5):>8.3f} "
+                f"{percentile(times, 0.99):>8.3f} {times[-1]:>8.3f} {events:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
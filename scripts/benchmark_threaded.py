@@ -0,0 +1,80 @@
+"""Compare simulation tick jitter with and without the simulation thread
+
+Plays headless matches with an artificially slow renderer (every frame sleeps
+for a random 0 to SLOW_FRAME seconds, like a stalled flip) and reports how
+evenly Game.update runs: once interleaved with rendering as in Game.run,
+once on ThreadedRunner's simulation thread.
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/benchmark_threaded.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+import pygame  # noqa: E402
+from src.constants import clock  # noqa: E402
+from src.game import Game  # noqa: E402
+from src.threaded import JitterStats, ThreadedRunner  # noqa: E402
+
+SECONDS = 5
+SLOW_FRAME = 0.04  # Longest render stall in seconds
+
+
+def slow(draw):
+    """Wrap a draw method so that it stalls for up to SLOW_FRAME seconds"""
+
+    def slow_draw():
+        draw()
+        time.sleep(random.uniform(0, SLOW_FRAME))
+
+    return slow_draw
+
+
+def run_single_threaded():
+    """Game.run's loop with a slow draw; returns update jitter"""
+    game = Game()
+    game.max_score = None
+    game.start_match()
+    game.draw = slow(game.draw)
+    ticks = JitterStats("single thread", 1 / 60)
+    end = time.perf_counter() + SECONDS
+    while time.perf_counter() < end:
+        game.player_paddle.set_position(game.ball.rect.centery)
+        game.update()
+        ticks.mark()
+        game.draw()
+        clock.tick(60)
+    return ticks
+
+
+def run_threaded():
+    """ThreadedRunner with a slow draw; prints its jitter report on exit"""
+    game = Game()
+    runner = ThreadedRunner(game)
+    runner.view.draw = slow(runner.view.draw)
+    # Start a long match through the forwarded input, as a key press would
+    game.max_score_input = "50"
+    runner.inputs.put(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN))
+    threading.Timer(SECONDS, lambda: setattr(runner, "running", False)).start()
+    # ThreadedRunner.run shuts pygame down when it returns
+    runner.run()
+
+
+def main():
+    single = run_single_threaded()
+    print(f"Render stalls of up to {SLOW_FRAME * 1000:.0f} ms")
+    print(single.report())
+    run_threaded()
+
+
+if __name__ == "__main__":
+    main()
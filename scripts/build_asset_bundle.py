@@ -0,0 +1,99 @@
+"""Pack the sound effects into one pre-decoded asset bundle
+
+Each WAV file is converted to the mixer's device format (sample rate, signed
+16-bit samples, channel count) so the game can hand the bytes straight to
+pygame.mixer.Sound at startup without parsing or converting anything. The
+stereo-panned copies SoundManager plays are rendered here as well.
+"""
+
+import os
+import sys
+import wave
+from array import array
+
+# Run headless: importing src.constants opens a window and the mixer
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/build_asset_bundle.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.assets import AssetBundle, BUNDLE_NAME, assets_dir, write_bundle  # noqa: E402
+from src.constants import MIXER_CHANNELS, MIXER_FREQUENCY, MIXER_SIZE  # noqa: E402
+from src.sounds import SOUND_NAMES, pan_asset_name, pan_variants  # noqa: E402
+
+
+def read_wav(filepath):
+    """Return (samples, channels, sample_rate) with samples as signed 16-bit"""
+    with wave.open(filepath, "rb") as wav_file:
+        channels = wav_file.getnchannels()
+        width = wav_file.getsampwidth()
+        rate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+    if width == 1:
+        # 8-bit WAV is unsigned
+        samples = array("h", ((b - 128) << 8 for b in frames))
+    elif width == 2:
+        samples = array("h", frames)
+        if sys.byteorder == "big":
+            samples.byteswap()
+    else:
+        raise ValueError(f"Unsupported sample width {width} in {filepath}")
+    return samples, channels, rate
+
+
+def convert(samples, channels, rate):
+    """Convert interleaved 16-bit samples to the mixer's rate and channels"""
+    frames = len(samples) // channels
+    # Mix down to mono first, then resample with linear interpolation
+    mono = [
+        sum(samples[i * channels : (i + 1) * channels]) // channels
+        for i in range(frames)
+    ]
+    if rate != MIXER_FREQUENCY:
+        out_frames = frames * MIXER_FREQUENCY // rate
+        step = rate / MIXER_FREQUENCY
+        resampled = []
+        for i in range(out_frames):
+            position = i * step
+            index = int(position)
+            fraction = position - index
+            following = mono[min(index + 1, frames - 1)]
+            resampled.append(int(mono[index] + (following - mono[index]) * fraction))
+        mono = resampled
+    output = array("h")
+    for value in mono:
+        output.extend([value] * MIXER_CHANNELS)
+    if sys.byteorder == "big":
+        output.byteswap()
+    return output.tobytes()
+
+
+def main():
+    if MIXER_SIZE != -16:
+        raise SystemExit("Only signed 16-bit mixer formats are supported")
+    directory = assets_dir()
+    assets = {}
+    for name in SOUND_NAMES:
+        filepath = os.path.join(directory, f"{name}.wav")
+        assets[name] = convert(*read_wav(filepath))
+        print(f"{name}: {len(assets[name])} bytes")
+        for step, panned in enumerate(pan_variants(assets[name])):
+            if panned is not None:
+                assets[pan_asset_name(name, step)] = panned.tobytes()
+
+    bundle_path = os.path.join(directory, BUNDLE_NAME)
+    write_bundle(bundle_path, (MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS), assets)
+
+    # Integrity check: re-open the bundle and verify every entry
+    bundle = AssetBundle(bundle_path)
+    failed = bundle.verify()
+    bundle.close()
+    if failed:
+        raise SystemExit(f"Bundle verification failed for: {', '.join(failed)}")
+    print(f"Wrote {bundle_path} ({os.path.getsize(bundle_path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""A minimal external bot: follow the ball with every paddle it is given
+
+Listens on ADDRESS (a Unix socket path or host:port), serves one game
+connection until it closes, then exits. ``--delay`` holds every reply back,
+to try the real-time deadline of ``pong.py --bot-deadline``.
+
+    python scripts/example_bot.py /tmp/pong-bot.sock &
+    python pong.py --bot /tmp/pong-bot.sock
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Make the src package importable when run as scripts/example_bot.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+# Only the protocol module: importing the game would start pygame and open a
+# window in the bot process
+from src.botprotocol import FLAG_GAME_OVER, BotConnection, listen  # noqa: E402
+
+# Observations give top-left corners; sizes as in src/constants.py
+BALL_SIZE = 15
+PADDLE_HEIGHT = 100
+DEAD_ZONE = 8
+
+
+def choose_move(observation):
+    """Move towards the ball's center"""
+    offset = (
+        observation.ball_y + BALL_SIZE // 2 - observation.paddle_y - PADDLE_HEIGHT // 2
+    )
+    if offset < -DEAD_ZONE:
+        return -1
+    if offset > DEAD_ZONE:
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("address", help="Unix socket path or host:port")
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=0.0,
+        metavar="MS",
+        help="wait MS milliseconds before every reply",
+    )
+    args = parser.parse_args()
+    server = listen(args.address)
+    print(f"Waiting for a game on {args.address}", flush=True)
+    sock, _ = server.accept()
+    server.close()
+    connection = BotConnection(sock)
+    while True:
+        batch = connection.receive()
+        if batch is None:
+            break
+        step, observations = batch
+        moves = [
+            (observation.match, observation.side, choose_move(observation))
+            for observation in observations
+            if not observation.flags & FLAG_GAME_OVER
+        ]
+        if args.delay:
+            time.sleep(args.delay / 1000)
+        try:
+            connection.reply(step, moves)
+        except OSError:
+            break
+    connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Render a recorded match (see pong.py --record) to frames for encoding
+
+Raw output is a headerless RGB24 stream at 60 FPS, for example:
+
+    python scripts/export_video.py match.json out.rgb --format raw
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s 800x600 -r 60 -i out.rgb out.mp4
+
+PNG frames are named by tick, so ``--start 600`` begins at frame_000600.png:
+
+    python scripts/export_video.py match.json frames/ --start 600
+    ffmpeg -framerate 60 -start_number 600 -i frames/frame_%06d.png out.mp4
+"""
+
+import argparse
+import os
+import sys
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run as scripts/export_video.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.export import FORMATS, export_replay  # noqa: E402
+from src.replay import load_replay  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("replay", help="replay JSON written by pong.py --record")
+    parser.add_argument("output", help="frame directory (png) or stream file (raw)")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--workers", type=int, help="render processes (default: CPUs)")
+    parser.add_argument("--start", type=int, default=0, help="first tick to export")
+    parser.add_argument("--end", type=int, help="tick to stop before")
+    args = parser.parse_args()
+
+    frames, simulate_time, render_time = export_replay(
+        load_replay(args.replay),
+        args.output,
+        args.format,
+        args.workers,
+        args.start,
+        args.end,
+    )
+    print(
+        f"{frames} frames: simulated in {simulate_time:.2f}s, "
+        f"rendered in {render_time:.2f}s ({frames / render_time:.0f} frames/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
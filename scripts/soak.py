@@ -0,0 +1,459 @@
+"""Soak test: play thousands of scripted matches and watch for slow decay
+
+Drives one headless Game through the cabinet's whole life cycle over and over:
+the start menu (digits and ENTER typed as key events), a match played to
+max_score by a scripted player that moves the paddle through
+``Game.mouse_position``, a pause and resume mid-match, the game-over screen
+and ``reset_to_menu``. Every few cycles the match is abandoned from the pause
+screen with M instead.
+
+Frame times are recorded per screen and pooled over blocks of a few cycles,
+so a block's p99 rests on hundreds of frames rather than the 30 or so a menu
+or pause screen shows per cycle. RSS and the number of objects the garbage
+collector tracks are sampled after a collection at every phase boundary.
+After the warmup cycles, the first and last windows of cycles are compared:
+the run fails if RSS or the object count grew, or the median of a screen's
+per-block p50 or p99 frame time drifted, beyond the given bounds. When memory
+grew, a few more cycles run under tracemalloc to find the call sites that keep
+growing and the phase they grow in, and the report names that phase.
+"""
+
+import argparse
+import array
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Run headless: no window and no audio device, whatever the environment says
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+# Make the src package importable when run as scripts/soak.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+import pygame  # noqa: E402
+from src.constants import WINDOW_HEIGHT  # noqa: E402
+from src.display import Display  # noqa: E402
+from src.game import Game  # noqa: E402
+
+PHASES = ("menu", "playing", "paused", "game_over", "reset")
+MENU_FRAMES = 30
+PAUSE_FRAMES = 30
+GAME_OVER_FRAMES = 60
+# Pause this many frames into each match
+PAUSE_AFTER = 120
+# Abandon every Nth match from the pause screen instead of finishing it
+ABANDON_EVERY = 10
+# A match still running after this many frames counts as stuck and is reset
+MAX_MATCH_FRAMES = 20000
+# The scripted player's paddle speed in pixels per frame, and how often it
+# aims far enough off to miss
+PLAYER_SPEED = 14
+MISS_CHANCE = 0.35
+
+
+def window_size(value):
+    """Parse WIDTHxHEIGHT"""
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {value!r}")
+    return width, height
+
+
+def rss_bytes():
+    """Return the resident set size of this process"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # No procfs (macOS): fall back to the peak, which still catches growth
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentile(values, share):
+    """Return the value below which ``share`` of ``values`` fall"""
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * share), len(ordered) - 1)]
+
+
+def median(values):
+    return percentile(values, 0.5)
+
+
+class ScriptedPlayer:
+    """Synthetic mouse: chases the incoming ball and sometimes misses it"""
+
+    def __init__(self, game, rng):
+        self.game = game
+        self.rng = rng
+        self.y = WINDOW_HEIGHT // 2
+        self.aim = 0
+        self.incoming = False
+
+    def position(self):
+        ball = self.game.ball
+        incoming = ball.velocity_x < 0
+        if incoming and not self.incoming:
+            # New rally towards the player: decide where to aim this time
+            if self.rng.random() < MISS_CHANCE:
+                self.aim = self.rng.choice((-1, 1)) * 150
+            else:
+                self.aim = self.rng.randint(-20, 20)
+        self.incoming = incoming
+        target = ball.rect.centery + self.aim if incoming else WINDOW_HEIGHT // 2
+        step = max(-PLAYER_SPEED, min(PLAYER_SPEED, target - self.y))
+        self.y = max(0, min(WINDOW_HEIGHT - 1, self.y + step))
+        return (60, self.y)
+
+
+class Soak:
+    """Runs the scripted cycles and keeps per-phase samples"""
+
+    def __init__(self, game, max_score, seed, pool):
+        self.game = game
+        self.max_score = max_score
+        self.player = ScriptedPlayer(game, random.Random(seed))
+        # Synthetic input replaces the real mouse for handle_input
+        game.mouse_position = self.player.position
+        # Frame times of the current block of ``pool`` cycles
+        self.frame_times = {phase: array.array("d") for phase in PHASES}
+        self.pool = pool
+        self.pooled = 0
+        self.frames = 0
+        self.stuck = 0
+        self.measuring = False
+        # Per measured cycle: RSS and object count at its end. Per block:
+        # each phase's p50 and p99 frame time in seconds
+        self.rss = array.array("q")
+        self.objects = array.array("q")
+        self.p50 = {phase: array.array("d") for phase in PHASES}
+        self.p99 = {phase: array.array("d") for phase in PHASES}
+        # While probing: tracemalloc growth per call site and phase
+        self.site_growth = None
+        self.last_sample = self.sample()
+
+    def sample(self):
+        gc.collect()
+        return rss_bytes(), len(gc.get_objects())
+
+    def boundary(self, phase):
+        """Sample memory at the end of ``phase``"""
+        self.last_sample = self.sample()
+        if self.site_growth is not None:
+            snapshot = take_snapshot()
+            for stat in snapshot.compare_to(self.snapshot, "lineno"):
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    site = f"{frame.filename}:{frame.lineno}"
+                    growth = self.site_growth.setdefault(site, dict.fromkeys(PHASES, 0))
+                    growth[phase] += stat.size_diff
+            self.snapshot = snapshot
+
+    def frame(self, *keys):
+        """Run one frame of the game loop, with ``keys`` pressed first"""
+        game = self.game
+        start = time.perf_counter()
+        for key in keys:
+            game.handle_event(
+                pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="")
+            )
+        if game.game_started:
+            game.handle_input()
+            if not game.paused and not game.game_over:
+                game.update()
+            game.draw()
+        else:
+            game.draw_start_menu()
+        elapsed = time.perf_counter() - start
+        self.frame_times[game.frame_state()].append(elapsed)
+        self.frames += 1
+
+    def cycle(self, index):
+        """Play one cycle from the menu back to the menu"""
+        game = self.game
+        if not self.pooled:
+            for times in self.frame_times.values():
+                del times[:]
+
+        # Menu: clear the previous input, type max_score, rotate the AI
+        # difficulty and start
+        for _ in range(MENU_FRAMES):
+            self.frame()
+        self.frame(pygame.K_BACKSPACE, pygame.K_BACKSPACE)
+        self.frame(*(pygame.K_0 + int(digit) for digit in str(self.max_score)))
+        self.frame(pygame.K_a)
+        self.frame(pygame.K_RETURN)
+        self.boundary("menu")
+
+        abandon = (index + 1) % ABANDON_EVERY == 0
+        match_frames = 0
+        while game.game_started and not game.game_over:
+            if match_frames == PAUSE_AFTER:
+                self.boundary("playing")
+                self.frame(pygame.K_ESCAPE)
+                for _ in range(PAUSE_FRAMES):
+                    self.frame()
+                if abandon:
+                    self.frame(pygame.K_m)
+                    self.boundary("paused")
+                    break
+                self.frame(pygame.K_RETURN)
+                self.boundary("paused")
+            self.frame()
+            match_frames += 1
+            if match_frames >= MAX_MATCH_FRAMES:
+                self.stuck += 1
+                break
+        else:
+            self.boundary("playing")
+            for _ in range(GAME_OVER_FRAMES):
+                self.frame()
+            self.boundary("game_over")
+
+        if game.game_started:
+            start = time.perf_counter()
+            game.reset_to_menu()
+            self.frame_times["reset"].append(time.perf_counter() - start)
+            self.boundary("reset")
+
+        if not self.measuring:
+            self.pooled = 0
+            return
+        self.rss.append(self.last_sample[0])
+        self.objects.append(self.last_sample[1])
+        self.pooled += 1
+        if self.pooled == self.pool:
+            self.pooled = 0
+            for phase, times in self.frame_times.items():
+                if times:
+                    self.p50[phase].append(median(times))
+                    self.p99[phase].append(percentile(times, 0.99))
+
+    def probe(self, first_index, cycles):
+        """Find the call sites that keep growing, and the phase they grow in
+
+        Replays ``cycles`` more cycles under tracemalloc with a snapshot at
+        every phase boundary, the way FrameDiagnostics samples per screen.
+        Sites holding more memory at the end than at the start are leaking;
+        each is charged to the phase in which it grew the most, since memory
+        allocated in one phase and freed in a later one also shows up as
+        growth while it is alive. Returns [(bytes, blocks, phase, site)] per
+        cycle, largest first.
+        """
+        tracemalloc.start()
+        self.measuring = False
+        self.site_growth = {}
+        self.snapshot = first = take_snapshot()
+        for index in range(first_index, first_index + cycles):
+            self.cycle(index)
+        leaks = []
+        for stat in take_snapshot().compare_to(first, "lineno"):
+            if stat.size_diff > 0 and stat.count_diff > 0:
+                frame = stat.traceback[0]
+                site = f"{frame.filename}:{frame.lineno}"
+                growth = self.site_growth.get(site)
+                phase = max(PHASES, key=growth.get) if growth else "reset"
+                leaks.append(
+                    (stat.size_diff / cycles, stat.count_diff / cycles, phase, site)
+                )
+        self.site_growth = None
+        tracemalloc.stop()
+        leaks.sort(reverse=True)
+        return leaks
+
+
+def take_snapshot():
+    """Snapshot traced allocations, leaving out tracemalloc's and the soak
+    test's own"""
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+    )
+
+
+def drift(first, last):
+    """Return the relative change from ``first`` to ``last``"""
+    return (last - first) / first if first > 0 else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument(
+        "--warmup", type=int, default=20, help="cycles before measuring starts"
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=None,
+        help="cycles per comparison window (default: a tenth of the run)",
+    )
+    parser.add_argument(
+        "--pool",
+        type=int,
+        default=10,
+        help="cycles whose frame times are pooled into one p50/p99 sample",
+    )
+    parser.add_argument("--max-score", type=int, default=3)
+    parser.add_argument("--speed", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--display",
+        type=window_size,
+        metavar="WxH",
+        help="present through a scaled Display of this size",
+    )
+    parser.add_argument(
+        "--max-rss-growth", type=float, default=8.0, help="MB, first to last window"
+    )
+    parser.add_argument(
+        "--max-object-growth",
+        type=int,
+        default=500,
+        help="tracked objects, first to last window",
+    )
+    # A clean tree on a shared machine drifts by up to about 50% over a run,
+    # as the host's speed changes, so the bounds only flag a clear slowdown
+    parser.add_argument(
+        "--max-p50-drift", type=float, default=0.75, help="relative, per screen"
+    )
+    parser.add_argument(
+        "--max-p99-drift", type=float, default=1.0, help="relative, per screen"
+    )
+    parser.add_argument(
+        "--drift-slack",
+        type=float,
+        default=0.1,
+        help="ms a frame time may drift regardless of the relative bounds",
+    )
+    parser.add_argument(
+        "--probe-cycles",
+        type=int,
+        default=10,
+        help="cycles traced with tracemalloc to find the phase behind memory "
+        "growth (0 to skip)",
+    )
+    args = parser.parse_args()
+    if args.cycles <= args.warmup:
+        parser.error("--cycles must be larger than --warmup")
+    if args.pool < 1:
+        parser.error("--pool must be at least 1")
+    window = args.window or max((args.cycles - args.warmup) // 10, 1)
+    window = min(window, (args.cycles - args.warmup) // 2 or 1)
+
+    display = Display(args.display) if args.display is not None else None
+    random.seed(args.seed)
+    game = Game(display=display)
+    game.set_speed(args.speed)
+    soak = Soak(game, args.max_score, args.seed, args.pool)
+
+    start = time.perf_counter()
+    for index in range(args.cycles):
+        soak.measuring = index >= args.warmup
+        soak.cycle(index)
+        if (index + 1) % 100 == 0:
+            print(
+                f"cycle {index + 1}: {soak.frames} frames, "
+                f"RSS {soak.last_sample[0] / 2**20:.1f} MB, "
+                f"{soak.last_sample[1]} objects",
+                flush=True,
+            )
+    elapsed = time.perf_counter() - start
+
+    failures = []
+    print(
+        f"\n{args.cycles} cycles ({args.warmup} warmup), {soak.frames} frames "
+        f"in {elapsed:.0f} s, {soak.stuck} stuck matches, "
+        f"comparing windows of {window} cycles, frame times pooled over "
+        f"{args.pool} cycles"
+    )
+    print(
+        f"{'phase':<10} {'p50 first':>10} {'p50 last':>9} "
+        f"{'p99 first':>10} {'p99 last':>9}"
+    )
+    for phase in PHASES:
+        if len(soak.p50[phase]) < 2:
+            continue
+        # Windows over the blocks that reached this phase
+        span = max(min(window // args.pool, len(soak.p50[phase]) // 2), 1)
+        first = []
+        last = []
+        for samples in (soak.p50[phase], soak.p99[phase]):
+            first.append(median(samples[:span]) * 1e3)
+            last.append(median(samples[-span:]) * 1e3)
+        print(
+            f"{phase:<10} {first[0]:>10.3f} {last[0]:>9.3f} "
+            f"{first[1]:>10.3f} {last[1]:>9.3f}"
+        )
+        for name, i, bound in (
+            ("p50", 0, args.max_p50_drift),
+            ("p99", 1, args.max_p99_drift),
+        ):
+            change = drift(first[i], last[i])
+            if change > bound and last[i] - first[i] > args.drift_slack:
+                failures.append(
+                    f"{phase} {name} frame time drifted from {first[i]:.3f} ms "
+                    f"to {last[i]:.3f} ms ({change:+.0%}, bound {bound:.0%})"
+                )
+
+    rss = soak.rss
+    objects = soak.objects
+    rss_change = (median(rss[-window:]) - median(rss[:window])) / 2**20
+    object_change = median(objects[-window:]) - median(objects[:window])
+    print(
+        f"RSS {rss_change:+.2f} MB, tracked objects {object_change:+}, "
+        f"first to last window"
+    )
+    memory_failures = []
+    if rss_change > args.max_rss_growth:
+        memory_failures.append(
+            f"RSS grew by {rss_change:.1f} MB (bound {args.max_rss_growth:g} MB)"
+        )
+    if object_change > args.max_object_growth:
+        memory_failures.append(
+            f"Tracked objects grew by {object_change} "
+            f"(bound {args.max_object_growth})"
+        )
+    if memory_failures and args.probe_cycles:
+        leaks = soak.probe(args.cycles, args.probe_cycles)
+        print(f"\nGrowing allocations over {args.probe_cycles} traced cycles:")
+        for size, count, phase, site in leaks[:10]:
+            print(
+                f"  {size:10.0f} B/cycle {count:8.1f} blocks/cycle  {phase:<10} {site}"
+            )
+        if leaks:
+            phase_leaks = dict.fromkeys(PHASES, 0)
+            for size, count, phase, site in leaks:
+                phase_leaks[phase] += size
+            phase = max(PHASES, key=phase_leaks.get)
+            site = next(leak[3] for leak in leaks if leak[2] == phase)
+            blame = (
+                f"most of it allocated during {phase} "
+                f"({phase_leaks[phase]:.0f} B/cycle, largest at {site})"
+            )
+        else:
+            blame = "no Python allocation site grew; look outside Python (SDL)"
+        memory_failures = [f"{failure}, {blame}" for failure in memory_failures]
+    failures.extend(memory_failures)
+    if soak.stuck:
+        failures.append(
+            f"{soak.stuck} matches did not end within {MAX_MATCH_FRAMES} frames"
+        )
+    pygame.quit()
+    if failures:
+        raise SystemExit("FAIL\n" + "\n".join(failures))
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Print aggregate statistics from a telemetry database"""
+
+import os
+import sys
+
+# Make the src package importable when run as scripts/telemetry_stats.py
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(script_dir))
+
+from src.telemetry import summarize  # noqa: E402
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python scripts/telemetry_stats.py TELEMETRY_DB")
+        sys.exit(1)
+    for key, value in summarize(sys.argv[1]).items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,10 @@ from .constants import PADDLE_WIDTH, PADDLE_HEIGHT, PADDLE_SPEED, WINDOW_HEIGHT,
 
 
 class AIPaddle:
-    def __init__(self, x, y, speed_multiplier=1.0, difficulty="medium"):
+    def __init__(self, x, y, speed_multiplier=1.0, difficulty="medium", direction=1):
         self.rect = pygame.Rect(x, y, PADDLE_WIDTH, PADDLE_HEIGHT)
+        # Side the paddle defends: 1 = right, -1 = left
+        self.direction = direction
         self.base_speed = PADDLE_SPEED
         self.speed_multiplier = speed_multiplier
         self.speed = self.base_speed * self.speed_multiplier
@@ -36,29 +38,97 @@ class AIPaddle:
     def update(self, ball):
         """AI tracks the ball with difficulty-based behavior"""
         # Predict ball position
-        if ball.velocity_x > 0:  # Ball moving towards AI
+        if ball.velocity_x * self.direction > 0:  # Ball moving towards AI
             target_y = ball.rect.centery
             # Add imperfection based on difficulty
             target_y += random.randint(
                 -self.imperfection_range, self.imperfection_range
             )
-
-            # Speed already includes speed_factor from update_speed
-            if self.rect.centery < target_y - self.reaction_threshold:
-                if self.rect.bottom < WINDOW_HEIGHT:
-                    self.rect.y += self.speed
-            elif self.rect.centery > target_y + self.reaction_threshold:
-                if self.rect.top > 0:
-                    self.rect.y -= self.speed
         else:
             # Move towards center when ball is moving away
-            center_y = WINDOW_HEIGHT // 2
-            if self.rect.centery < center_y - self.reaction_threshold:
-                if self.rect.bottom < WINDOW_HEIGHT:
-                    self.rect.y += self.speed
-            elif self.rect.centery > center_y + self.reaction_threshold:
-                if self.rect.top > 0:
-                    self.rect.y -= self.speed
+            target_y = WINDOW_HEIGHT // 2
+        self._move_towards(target_y)
+
+    def _move_towards(self, target_y):
+        """Take one step towards ``target_y`` unless within reaction range"""
+        # Speed already includes speed_factor from update_speed
+        if self.rect.centery < target_y - self.reaction_threshold:
+            if self.rect.bottom < WINDOW_HEIGHT:
+                self.rect.y += self.speed
+        elif self.rect.centery > target_y + self.reaction_threshold:
+            if self.rect.top > 0:
+                self.rect.y -= self.speed
+
+    def skip_ticks(self, ticks, incoming, ball_centery, ball_dy):
+        """Apply ``ticks`` updates at once for a ball moving in a straight line
+
+        The ball's center is at ``ball_centery + t * ball_dy`` on tick ``t``
+        (1 to ``ticks``) and ``incoming`` tells whether it moves towards this
+        paddle. The result matches ``ticks`` calls to ``update``.
+        """
+        rect = self.rect
+        threshold = self.reaction_threshold
+        down = self._step(self.speed)
+        up = self._step(-self.speed)
+        if incoming:
+            # Every tick draws a random target, which has to happen tick by
+            # tick to leave the random generator exactly where update would;
+            # the rest of update is inlined on a plain int
+            randint = random.randint
+            spread = self.imperfection_range
+            half = rect.height // 2
+            lowest = WINDOW_HEIGHT - rect.height
+            y = rect.y
+            for t in range(1, ticks + 1):
+                target_y = ball_centery + t * ball_dy + randint(-spread, spread)
+                if y + half < target_y - threshold:
+                    if y < lowest:
+                        y = y + down if y >= 1 else self._moved(y, self.speed)
+                elif y + half > target_y + threshold:
+                    if y > 0:
+                        y = y + up if y + up >= 1 else self._moved(y, -self.speed)
+            rect.y = y
+            return
+        # Moving back to the center is deterministic: cover each run of steps
+        # in one direction in closed form
+        center_y = WINDOW_HEIGHT // 2
+        while ticks > 0:
+            if rect.centery < center_y - threshold and rect.bottom < WINDOW_HEIGHT:
+                steps = min(
+                    -(-(center_y - threshold - rect.centery) // down),
+                    -(-(WINDOW_HEIGHT - rect.bottom) // down),
+                )
+                step = down
+            elif rect.centery > center_y + threshold and rect.top > 0:
+                steps = min(
+                    -(-(rect.centery - center_y - threshold) // -up),
+                    -(-rect.top // -up),
+                )
+                step = up
+            else:
+                return  # Within reaction range: the paddle stays put
+            steps = min(steps, ticks)
+            if rect.top < 1:
+                steps = 1  # Starting at the edge, where rounding differs
+            # The last step may leave the field, so it is taken for real
+            rect.y += (steps - 1) * step
+            self._move_towards(center_y)
+            ticks -= steps
+
+    def _moved(self, y, speed):
+        """Return where one move of ``speed`` takes a paddle at ``y``
+
+        Rect rounds fractional moves; away from the field edges every move
+        of the same speed shifts the paddle by the same whole number of pixels.
+        """
+        probe = self.rect.copy()
+        probe.y = y
+        probe.y += speed
+        return probe.y
+
+    def _step(self, speed):
+        """Return how far one move of ``speed`` shifts the paddle mid-field"""
+        return self._moved(WINDOW_HEIGHT // 2, speed) - WINDOW_HEIGHT // 2
 
     def draw(self, surface):
         pygame.draw.rect(surface, WHITE, self.rect)
@@ -0,0 +1,129 @@
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+# Bundle layout (all little-endian):
+#   header:  magic, version, mixer frequency, mixer size, mixer channels,
+#            entry count, CRC32 of the entry table
+#   entries: name, offset, length, CRC32 of the data (one per asset)
+#   data:    each asset's bytes, starting on a 16-byte boundary
+BUNDLE_MAGIC = b"PONGPAK\0"
+BUNDLE_VERSION = 1
+BUNDLE_NAME = "assets.pak"
+_HEADER = struct.Struct("<8sHiiHII")
+_ENTRY = struct.Struct("<32sQQI")
+_ALIGN = 16
+
+
+class BundleError(Exception):
+    """Raised when an asset bundle is missing, corrupt or unusable"""
+
+
+def assets_dir():
+    """Return the assets directory, from a frozen executable or the source tree"""
+    if getattr(sys, "frozen", False):
+        # If running as a compiled executable
+        base_path = sys._MEIPASS
+    else:
+        # If running as a script
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, "assets")
+
+
+def write_bundle(path, mixer_format, assets):
+    """Write ``assets`` (a dict of name -> bytes) to a bundle file
+
+    ``mixer_format`` is the ``(frequency, size, channels)`` tuple the sound
+    data was converted to; the loader refuses bundles built for another format.
+    """
+    names = sorted(assets)
+    offset = _HEADER.size + _ENTRY.size * len(names)
+    table = b""
+    data = b""
+    for name in names:
+        encoded = name.encode("utf-8")
+        if len(encoded) > 32:
+            raise BundleError(f"Asset name too long for bundle: {name}")
+        padding = -(offset + len(data)) % _ALIGN
+        data += b"\0" * padding
+        blob = assets[name]
+        table += _ENTRY.pack(encoded, offset + len(data), len(blob), zlib.crc32(blob))
+        data += blob
+    frequency, size, channels = mixer_format
+    header = _HEADER.pack(
+        BUNDLE_MAGIC,
+        BUNDLE_VERSION,
+        frequency,
+        size,
+        channels,
+        len(names),
+        zlib.crc32(table),
+    )
+    with open(path, "wb") as bundle_file:
+        bundle_file.write(header + table + data)
+
+
+class AssetBundle:
+    """Read-only, memory-mapped view of an asset bundle
+
+    Asset data is never parsed or copied on open: ``get`` returns a
+    memoryview slice straight into the mapping.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path, "rb") as bundle_file:
+                self._mmap = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise BundleError(f"Could not open bundle {path}: {e}")
+        self._view = memoryview(self._mmap)
+        self.entries = {}
+        try:
+            self._read_index()
+        except BundleError:
+            self.close()
+            raise
+
+    def _read_index(self):
+        view = self._view
+        if len(view) < _HEADER.size:
+            raise BundleError(f"Bundle too short: {self.path}")
+        magic, version, frequency, size, channels, count, table_crc = (
+            _HEADER.unpack_from(view)
+        )
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise BundleError(f"Not a version {BUNDLE_VERSION} bundle: {self.path}")
+        self.mixer_format = (frequency, size, channels)
+        table_end = _HEADER.size + _ENTRY.size * count
+        if table_end > len(view) or zlib.crc32(view[_HEADER.size : table_end]) != (
+            table_crc
+        ):
+            raise BundleError(f"Corrupt bundle index: {self.path}")
+        for i in range(count):
+            name, offset, length, crc = _ENTRY.unpack_from(
+                view, _HEADER.size + i * _ENTRY.size
+            )
+            if offset + length > len(view):
+                raise BundleError(f"Truncated bundle: {self.path}")
+            self.entries[name.rstrip(b"\0").decode("utf-8")] = (offset, length, crc)
+
+    def get(self, name):
+        """Return a memoryview of an asset's bytes"""
+        offset, length, _ = self.entries[name]
+        return self._view[offset : offset + length]
+
+    def verify(self):
+        """Check every asset against its CRC32; returns names that fail"""
+        return [
+            name
+            for name, (offset, length, crc) in self.entries.items()
+            if zlib.crc32(self._view[offset : offset + length]) != crc
+        ]
+
+    def close(self):
+        """Unmap the bundle; views returned by ``get`` must be released first"""
+        self._view.release()
+        self._mmap.close()
@@ -11,9 +11,9 @@ from .constants import (
 
 
 class Ball:
-    def __init__(self, speed_multiplier=1.0, sound_manager=None):
+    def __init__(self, speed_multiplier=1.0):
         self.speed_multiplier = speed_multiplier
-        self.sound_manager = sound_manager
+        self.last_hit_offset = 0.0  # Where the last paddle hit landed (-1 to 1)
         self.reset()
 
     def update_speed(self, multiplier):
@@ -40,16 +40,15 @@ class Ball:
         self.velocity_y = int(base_velocity * random.choice([-1, 1]))
 
     def update(self):
-        """Update ball position"""
+        """Update ball position; returns True if the ball bounced off a wall"""
         self.rect.x += self.velocity_x
         self.rect.y += self.velocity_y
 
         # Bounce off top and bottom walls
         if self.rect.top <= 0 or self.rect.bottom >= WINDOW_HEIGHT:
             self.velocity_y = -self.velocity_y
-            # Play wall hit sound
-            if self.sound_manager:
-                self.sound_manager.play_wall_hit()
+            return True
+        return False
 
     def check_collision(self, paddle):
         """Check collision with paddle and reverse direction"""
@@ -58,6 +57,7 @@ class Ball:
             self.velocity_x = -self.velocity_x
             # Add some spin based on where ball hits paddle
             hit_pos = (self.rect.centery - paddle.rect.centery) / (PADDLE_HEIGHT // 2)
+            self.last_hit_offset = hit_pos
             self.velocity_y += hit_pos * 2
             # Keep speed reasonable
             max_velocity = BALL_SPEED * self.speed_multiplier * 2
@@ -70,9 +70,6 @@ class Ball:
                 self.rect.left = paddle.rect.right
             else:
                 self.rect.right = paddle.rect.left
-            # Play paddle hit sound
-            if self.sound_manager:
-                self.sound_manager.play_paddle_hit()
             return True
         return False
 
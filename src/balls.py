@@ -0,0 +1,346 @@
+import pygame
+import random
+from array import array
+from .constants import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    BALL_SIZE,
+    BALL_SPEED,
+    PADDLE_HEIGHT,
+    GRID_CELL_SIZE,
+    SPAWN_BAND_WIDTH,
+    WHITE,
+)
+
+
+def _zeros(typecode, length):
+    """Create a zero-filled array of the given length"""
+    return array(typecode, bytes(array(typecode).itemsize * length))
+
+
+class UniformGrid:
+    """Uniform-grid broadphase bucketing ball indices by the cell of their center
+
+    Buckets are stored in compressed form: ``items`` holds ball indices sorted
+    by cell and ``cell_start[c]:cell_start[c + 1]`` is the slice for cell ``c``.
+    All arrays are allocated once, so rebuilding every tick is allocation free.
+    """
+
+    __slots__ = (
+        "cell_size",
+        "cols",
+        "rows",
+        "cell_of",
+        "cell_start",
+        "items",
+        "_fill",
+        "_empty",
+    )
+
+    def __init__(self, width, height, cell_size, capacity):
+        self.cell_size = cell_size
+        self.cols = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        num_cells = self.cols * self.rows
+        self.cell_of = _zeros("l", capacity)
+        self.items = _zeros("l", capacity)
+        self.cell_start = _zeros("l", num_cells + 1)
+        self._fill = _zeros("l", num_cells + 1)
+        self._empty = _zeros("l", num_cells + 1)
+
+    def _col(self, x):
+        col = int(x) // self.cell_size
+        return 0 if col < 0 else (self.cols - 1 if col >= self.cols else col)
+
+    def _row(self, y):
+        row = int(y) // self.cell_size
+        return 0 if row < 0 else (self.rows - 1 if row >= self.rows else row)
+
+    def build(self, xs, ys, count):
+        """Bucket the first ``count`` balls (top-left positions) by cell"""
+        half = BALL_SIZE // 2
+        cols = self.cols
+        cell_of = self.cell_of
+        start = self.cell_start
+        start[:] = self._empty
+        for i in range(count):
+            cell = self._row(ys[i] + half) * cols + self._col(xs[i] + half)
+            cell_of[i] = cell
+            start[cell + 1] += 1
+        for cell in range(1, len(start)):
+            start[cell] += start[cell - 1]
+        fill = self._fill
+        fill[:] = start
+        items = self.items
+        for i in range(count):
+            cell = cell_of[i]
+            items[fill[cell]] = i
+            fill[cell] += 1
+
+    def query(self, left, top, right, bottom):
+        """Yield indices of balls that may overlap the given rectangle"""
+        # Balls are bucketed by center, so widen the query by half a ball
+        half = BALL_SIZE // 2 + 1
+        col_start = self._col(left - half)
+        col_end = self._col(right + half)
+        start = self.cell_start
+        items = self.items
+        for row in range(self._row(top - half), self._row(bottom + half) + 1):
+            base = row * self.cols
+            for cell in range(base + col_start, base + col_end + 1):
+                for k in range(start[cell], start[cell + 1]):
+                    yield items[k]
+
+
+class TrackedBall:
+    """Ball-like view of a single ball in a BallStore (for AIPaddle)"""
+
+    __slots__ = ("rect", "velocity_x")
+
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, BALL_SIZE, BALL_SIZE)
+        self.velocity_x = 0
+
+
+class BallStore:
+    """Array-backed store for the balls of multi-ball chaos mode
+
+    Ball state lives in parallel ``array`` columns instead of per-ball ``Ball``
+    objects, so moving hundreds of balls is one tight loop per tick and
+    paddle/ball collisions go through a uniform-grid broadphase. The last ball
+    involved in each kind of event is remembered so Game can report one event
+    per tick, however many balls took part. Every paddle hit of the tick is
+    also kept in the ``hit_*`` columns (the first ``hit_count`` entries), and
+    the goals on each side in ``left_goals`` and ``right_goals``, for
+    telemetry.
+    """
+
+    __slots__ = (
+        "count",
+        "speed_multiplier",
+        "ball_collisions",
+        "last_hit",
+        "last_hit_offset",
+        "left_goal_y",
+        "right_goal_y",
+        "hit_count",
+        "hit_paddles",
+        "hit_offsets",
+        "hit_speeds",
+        "left_goals",
+        "right_goals",
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "grid",
+        "tracked",
+        "sprite",
+        "_blit_sequence",
+    )
+
+    def __init__(self, count, speed_multiplier=1.0, ball_collisions=False):
+        self.count = count
+        self.speed_multiplier = speed_multiplier
+        self.ball_collisions = ball_collisions
+        self.last_hit = -1  # Last ball that hit a paddle
+        self.last_hit_offset = 0.0  # Where it landed on the paddle (-1 to 1)
+        self.left_goal_y = 0.0  # Height of the last ball to leave on each side
+        self.right_goal_y = 0.0
+        # Every hit of the current tick: the paddle (index into the paddles
+        # passed to check_collisions), offset and ball speed after the
+        # bounce. A ball hits each paddle at most once per tick.
+        self.hit_count = 0
+        self.hit_paddles = _zeros("b", 2 * count)
+        self.hit_offsets = _zeros("d", 2 * count)
+        self.hit_speeds = _zeros("d", 2 * count)
+        self.left_goals = 0
+        self.right_goals = 0
+        self.x = _zeros("d", count)
+        self.y = _zeros("d", count)
+        self.vx = _zeros("d", count)
+        self.vy = _zeros("d", count)
+        self.grid = UniformGrid(WINDOW_WIDTH, WINDOW_HEIGHT, GRID_CELL_SIZE, count)
+        self.tracked = TrackedBall()
+        self.sprite = pygame.Surface((BALL_SIZE, BALL_SIZE))
+        self.sprite.fill(WHITE)
+        self._blit_sequence = [(self.sprite, (0, 0))] * count
+        self.reset()
+
+    def _spawn(self, i):
+        """Respawn ball ``i`` near the center line with a random direction
+
+        Spreading spawns over a band of grid columns keeps balls (which all
+        move sideways at the same speed) from sharing one broadphase column.
+        """
+        base_velocity = BALL_SPEED * self.speed_multiplier
+        left = WINDOW_WIDTH // 2 - SPAWN_BAND_WIDTH // 2
+        self.x[i] = random.randint(left, left + SPAWN_BAND_WIDTH - BALL_SIZE)
+        self.y[i] = random.randint(0, WINDOW_HEIGHT - BALL_SIZE)
+        self.vx[i] = int(base_velocity * random.choice([-1, 1]))
+        self.vy[i] = int(base_velocity * random.choice([-1, 1]))
+
+    def reset(self):
+        """Respawn every ball"""
+        for i in range(self.count):
+            self._spawn(i)
+
+    def update_speed(self, multiplier):
+        """Update speed multiplier and rescale every ball's velocity"""
+        self.speed_multiplier = multiplier
+        target = BALL_SPEED * multiplier
+        vx, vy = self.vx, self.vy
+        for i in range(self.count):
+            current_speed = (vx[i] ** 2 + vy[i] ** 2) ** 0.5
+            if current_speed > 0:
+                scale = target / current_speed
+                vx[i] = int(vx[i] * scale)
+                vy[i] = int(vy[i] * scale)
+
+    def update(self):
+        """Move every ball and bounce off top and bottom walls
+
+        Returns the index of the last ball that bounced, or -1.
+        """
+        xs, ys, vx, vy = self.x, self.y, self.vx, self.vy
+        bottom = WINDOW_HEIGHT - BALL_SIZE
+        wall_hit = -1
+        for i in range(self.count):
+            xs[i] += vx[i]
+            y = ys[i] + vy[i]
+            ys[i] = y
+            if y <= 0 or y >= bottom:
+                vy[i] = -vy[i]
+                wall_hit = i
+        return wall_hit
+
+    def check_collisions(self, paddles):
+        """Resolve ball-paddle (and optionally ball-ball) collisions
+
+        Returns the number of paddle hits this tick.
+        """
+        grid = self.grid
+        grid.build(self.x, self.y, self.count)
+        self.hit_count = 0
+        for index, paddle in enumerate(paddles):
+            self._collide_paddle(paddle.rect, index)
+        if self.ball_collisions:
+            self._collide_balls()
+        return self.hit_count
+
+    def _collide_paddle(self, paddle_rect, index):
+        """Bounce balls off one paddle, mirroring Ball.check_collision"""
+        xs, ys, vx, vy = self.x, self.y, self.vx, self.vy
+        left, top = paddle_rect.left, paddle_rect.top
+        right, bottom = paddle_rect.right, paddle_rect.bottom
+        centery = paddle_rect.centery
+        max_velocity = BALL_SPEED * self.speed_multiplier * 2
+        hits = self.hit_count
+        for i in self.grid.query(left, top, right, bottom):
+            x, y = xs[i], ys[i]
+            if x < right and x + BALL_SIZE > left and y < bottom and y + BALL_SIZE > top:
+                vx[i] = -vx[i]
+                hit_pos = (y + BALL_SIZE // 2 - centery) / (PADDLE_HEIGHT // 2)
+                new_vy = vy[i] + hit_pos * 2
+                if abs(new_vy) > max_velocity:
+                    new_vy = int(max_velocity * (1 if new_vy > 0 else -1))
+                vy[i] = new_vy
+                # Move ball away from paddle to prevent sticking
+                xs[i] = right if vx[i] > 0 else left - BALL_SIZE
+                self.last_hit = i
+                self.last_hit_offset = hit_pos
+                self.hit_paddles[hits] = index
+                self.hit_offsets[hits] = hit_pos
+                self.hit_speeds[hits] = (vx[i] ** 2 + new_vy**2) ** 0.5
+                hits += 1
+        self.hit_count = hits
+
+    def _collide_balls(self):
+        """Swap velocities of overlapping balls that are moving towards each other"""
+        xs, ys, vx, vy = self.x, self.y, self.vx, self.vy
+        grid = self.grid
+        cols, rows = grid.cols, grid.rows
+        start = grid.cell_start
+        items = grid.items
+        for cell in range(cols * rows):
+            first, last = start[cell], start[cell + 1]
+            if first == last:
+                continue
+            row, col = divmod(cell, cols)
+            # Pair each cell with itself and its forward half-neighbourhood so
+            # every pair of cells is visited exactly once
+            for other in (cell, cell + 1, cell + cols - 1, cell + cols, cell + cols + 1):
+                if other != cell:
+                    other_row, other_col = divmod(other, cols)
+                    if other_row >= rows or abs(other_col - col) > 1:
+                        continue
+                for a in range(first, last):
+                    i = items[a]
+                    xi, yi = xs[i], ys[i]
+                    b = a + 1 if other == cell else start[other]
+                    for b in range(b, start[other + 1]):
+                        j = items[b]
+                        dx = xs[j] - xi
+                        dy = ys[j] - yi
+                        if -BALL_SIZE < dx < BALL_SIZE and -BALL_SIZE < dy < BALL_SIZE:
+                            # Equal masses: an elastic collision exchanges velocities
+                            if (vx[j] - vx[i]) * dx + (vy[j] - vy[i]) * dy < 0:
+                                vx[i], vx[j] = vx[j], vx[i]
+                                vy[i], vy[j] = vy[j], vy[i]
+
+    def collect_goals(self):
+        """Respawn balls that left the field
+
+        Returns ``(left_goals, right_goals)``: balls that went past the left
+        edge (AI scores) and past the right edge (player scores) this tick.
+        """
+        xs, ys = self.x, self.y
+        left_goals = 0
+        right_goals = 0
+        for i in range(self.count):
+            x = xs[i]
+            if x + BALL_SIZE < 0:
+                left_goals += 1
+                self.left_goal_y = ys[i] + BALL_SIZE // 2
+                self._spawn(i)
+            elif x > WINDOW_WIDTH:
+                right_goals += 1
+                self.right_goal_y = ys[i] + BALL_SIZE // 2
+                self._spawn(i)
+        self.left_goals = left_goals
+        self.right_goals = right_goals
+        return left_goals, right_goals
+
+    def track(self, direction):
+        """Return a ball-like view of the most urgent ball for an AI paddle
+
+        ``direction`` is the side the paddle defends (1 = right, -1 = left).
+        The most urgent ball is the incoming ball closest to that side; if
+        nothing is incoming the view reports a ball moving away.
+        """
+        xs, vx = self.x, self.vx
+        best = -1
+        best_distance = None
+        for i in range(self.count):
+            if vx[i] * direction > 0:
+                distance = -xs[i] * direction
+                if best_distance is None or distance < best_distance:
+                    best = i
+                    best_distance = distance
+        tracked = self.tracked
+        if best < 0:
+            tracked.velocity_x = -direction
+        else:
+            tracked.velocity_x = vx[best]
+            tracked.rect.x = xs[best]
+            tracked.rect.y = self.y[best]
+        return tracked
+
+    def draw(self, surface):
+        """Draw all balls with a single batched blit"""
+        sprite = self.sprite
+        xs, ys = self.x, self.y
+        sequence = self._blit_sequence
+        for i in range(self.count):
+            sequence[i] = (sprite, (xs[i], ys[i]))
+        surface.blits(sequence, doreturn=False)
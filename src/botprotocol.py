@@ -0,0 +1,122 @@
+import os
+import socket
+import struct
+from collections import namedtuple
+
+# Everything both ends of a bot connection need. This module imports neither
+# pygame nor the game, so bot processes can use it without opening a window.
+
+# Wire format (little-endian). Every message is a header followed by ``count``
+# fixed-size records: the game sends OBSERVATIONS, one record per bot-driven
+# paddle of every attached match, and the bot answers with MOVES carrying the
+# same step number.
+BOT_VERSION = 1
+OBSERVATIONS = 1
+MOVES = 2
+HEADER = struct.Struct("<BBHI")  # kind, version, record count, step
+OBSERVATION = struct.Struct("<HBBIhhffhhHH")
+MOVE = struct.Struct("<HBb")  # match, side, move (-1 up, 0 stay, 1 down)
+
+# Sides of the field
+LEFT = 0
+RIGHT = 1
+
+# Observation flags; a match's last observation carries FLAG_GAME_OVER, and
+# replies to it are ignored
+FLAG_GAME_OVER = 1
+
+RECV_SIZE = 65536
+
+Observation = namedtuple(
+    "Observation",
+    (
+        "match",
+        "side",
+        "flags",
+        "tick",
+        "ball_x",
+        "ball_y",
+        "ball_velocity_x",
+        "ball_velocity_y",
+        "paddle_y",
+        "opponent_y",
+        "score",
+        "opponent_score",
+    ),
+)
+
+
+def _address_family(address):
+    """Return (family, address) for "host:port" or a Unix socket path"""
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and os.sep not in address:
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    return socket.AF_UNIX, address
+
+
+def connect(address):
+    """Connect to a bot listening on ``address`` ("host:port" or a socket path)"""
+    family, address = _address_family(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.connect(address)
+    if family == socket.AF_INET:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def listen(address):
+    """Return a socket listening on ``address`` for a game to connect to"""
+    family, address = _address_family(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    if family == socket.AF_UNIX and os.path.exists(address):
+        os.unlink(address)
+    sock.bind(address)
+    sock.listen()
+    return sock
+
+
+class BotConnection:
+    """Bot side of the protocol: receive observation batches, reply with moves"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self._inbox = bytearray()
+
+    def receive(self):
+        """Return (step, list of Observation), or None once the game is gone"""
+        inbox = self._inbox
+        while True:
+            if len(inbox) >= HEADER.size:
+                kind, version, count, step = HEADER.unpack_from(inbox)
+                if kind != OBSERVATIONS or version != BOT_VERSION:
+                    raise ValueError("Not a version 1 observation message")
+                end = HEADER.size + count * OBSERVATION.size
+                if len(inbox) >= end:
+                    records = bytes(inbox[HEADER.size : end])
+                    observations = [
+                        Observation._make(record)
+                        for record in OBSERVATION.iter_unpack(records)
+                    ]
+                    del inbox[:end]
+                    return step, observations
+            try:
+                data = self.sock.recv(RECV_SIZE)
+            except ConnectionResetError:
+                # The game closed without reading the reply to its last message
+                return None
+            if not data:
+                return None
+            inbox += data
+
+    def reply(self, step, moves):
+        """Send ``moves``, (match, side, move) tuples, as the answer to ``step``"""
+        message = bytearray(HEADER.size + len(moves) * MOVE.size)
+        HEADER.pack_into(message, 0, MOVES, BOT_VERSION, len(moves), step)
+        offset = HEADER.size
+        for move in moves:
+            MOVE.pack_into(message, offset, *move)
+            offset += MOVE.size
+        self.sock.sendall(message)
+
+    def close(self):
+        self.sock.close()
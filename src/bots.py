@@ -0,0 +1,285 @@
+import select
+import time
+from .ai_paddle import AIPaddle
+from .botprotocol import (
+    BOT_VERSION,
+    FLAG_GAME_OVER,
+    HEADER,
+    LEFT,
+    MOVE,
+    MOVES,
+    OBSERVATION,
+    OBSERVATIONS,
+    RECV_SIZE,
+    RIGHT,
+)
+from .constants import WINDOW_HEIGHT
+
+# The wire protocol and the bot side of it live in src/botprotocol.py
+
+
+class BotPaddle(AIPaddle):
+    """AI paddle moved by an external bot, falling back to the built-in AI
+
+    BotController sets ``move`` before each tick; without a move (the bot
+    replied late or is gone) the paddle plays that tick like AIPaddle. Bot
+    moves use the player paddle's speed, not the difficulty's speed factor.
+    """
+
+    def __init__(self, x, y, speed_multiplier=1.0, difficulty="medium", direction=1):
+        super().__init__(x, y, speed_multiplier, difficulty, direction)
+        self.move = None
+        self.fallbacks = 0
+
+    def update(self, ball):
+        move = self.move
+        if move is None:
+            self.fallbacks += 1
+            AIPaddle.update(self, ball)
+            return
+        self.move = None
+        if move < 0:
+            if self.rect.top > 0:
+                self.rect.y -= self.base_speed * self.speed_multiplier
+        elif move > 0:
+            if self.rect.bottom < WINDOW_HEIGHT:
+                self.rect.y += self.base_speed * self.speed_multiplier
+
+
+class BotController:
+    """Drives paddles of one or more games from an external bot process
+
+    ``step`` sends one OBSERVATIONS message covering every bot-driven paddle
+    of every attached match and applies the MOVES reply, so a bot serving
+    many matches costs one round trip per tick rather than one per match.
+    With ``deadline=None`` (lockstep) each step waits for the reply; with a
+    deadline in seconds (real time) a reply that misses it is dropped and the
+    paddles fall back to the built-in AI for that tick.
+    """
+
+    def __init__(self, sock, deadline=None):
+        self.sock = sock
+        self.deadline = deadline
+        if deadline is not None:
+            sock.setblocking(False)
+        self.matches = []
+        self.ticks = []
+        self.paddles = {}
+        self.steps = 0
+        self.late = 0
+        self.closed = False
+        self._finished = set()  # Matches whose game over the bot was sent
+        self._inbox = bytearray()
+        self._outbox = bytearray()
+
+    def attach(self, game, left=False, right=True):
+        """Hand the chosen paddles of ``game`` to the bot; return the match id
+
+        Driving the left paddle needs an AI-vs-AI game, where Game.update
+        moves both paddles.
+        """
+        if game.ball_store is not None:
+            raise ValueError("Bots need single-ball mode")
+        if left and not game.ai_vs_ai:
+            raise ValueError("A bot can only drive the left paddle in AI-vs-AI mode")
+        match = len(self.matches)
+        sides = []
+        for side, wanted in ((LEFT, left), (RIGHT, right)):
+            if not wanted:
+                continue
+            attribute = "player_paddle" if side == LEFT else "ai_paddle"
+            old = getattr(game, attribute)
+            paddle = BotPaddle(
+                old.rect.x,
+                old.rect.y,
+                old.speed_multiplier,
+                old.difficulty,
+                old.direction,
+            )
+            paddle.update_speed(old.speed_multiplier)
+            setattr(game, attribute, paddle)
+            self.paddles[match, side] = paddle
+            sides.append(side)
+        self.matches.append((game, tuple(sides)))
+        self.ticks.append(0)
+        return match
+
+    def subscribe(self, events):
+        """Step before every tick of the game that owns ``events``
+
+        When that game ends, every match that just ended is sent a final
+        observation with FLAG_GAME_OVER.
+        """
+        events.subscribe("tick_start", self.step)
+        events.subscribe(
+            "game_over", lambda winner, player_score, ai_score: self.finish()
+        )
+
+    def _observations(self, matches):
+        """Return an OBSERVATIONS message for ``matches``, a new step"""
+        self.steps += 1
+        records = []
+        for match in matches:
+            game, sides = self.matches[match]
+            ball = game.ball
+            flags = FLAG_GAME_OVER if game.game_over else 0
+            for side in sides:
+                if side == LEFT:
+                    own, other = game.player_paddle, game.ai_paddle
+                    score, other_score = game.player_score, game.ai_score
+                else:
+                    own, other = game.ai_paddle, game.player_paddle
+                    score, other_score = game.ai_score, game.player_score
+                records.append(
+                    (
+                        match,
+                        side,
+                        flags,
+                        self.ticks[match],
+                        ball.rect.x,
+                        ball.rect.y,
+                        ball.velocity_x,
+                        ball.velocity_y,
+                        own.rect.y,
+                        other.rect.y,
+                        score,
+                        other_score,
+                    )
+                )
+        message = bytearray(HEADER.size + len(records) * OBSERVATION.size)
+        HEADER.pack_into(
+            message, 0, OBSERVATIONS, BOT_VERSION, len(records), self.steps
+        )
+        offset = HEADER.size
+        for record in records:
+            OBSERVATION.pack_into(message, offset, *record)
+            offset += OBSERVATION.size
+        return message
+
+    def step(self):
+        """Send the observations of every attached match and apply the moves"""
+        if self.closed:
+            return
+        ticks = self.ticks
+        finished = self._finished
+        for match, (game, _) in enumerate(self.matches):
+            ticks[match] += 1
+            if not game.game_over:
+                finished.discard(match)
+        message = self._observations(range(len(self.matches)))
+        try:
+            if self._send(message):
+                moves = self._receive(self.steps)
+            else:
+                self.late += 1
+                moves = None
+        except OSError:
+            moves = None
+            self._close()
+        if moves is None:
+            return
+        paddles = self.paddles
+        for match, side, move in MOVE.iter_unpack(moves):
+            paddle = paddles.get((match, side))
+            if paddle is not None:
+                paddle.move = move
+
+    def finish(self):
+        """Send a final observation with FLAG_GAME_OVER for matches that ended
+
+        Each ended match is reported once (until it is played again); the
+        bot's reply is dropped unread like any late one.
+        """
+        if self.closed:
+            return
+        ended = [
+            match
+            for match, (game, _) in enumerate(self.matches)
+            if game.game_over and match not in self._finished
+        ]
+        if not ended:
+            return
+        self._finished.update(ended)
+        try:
+            self._send(self._observations(ended))
+        except OSError:
+            self._close()
+
+    def _send(self, message):
+        """Send ``message``; False if it was dropped because the bot lags
+
+        In real time the socket is non-blocking. Whatever does not fit in the
+        send buffer waits in an outbox, and while it is not empty the bot is
+        behind, so new observations are dropped instead of piling up.
+        """
+        if self.deadline is None:
+            self.sock.sendall(message)
+            return True
+        outbox = self._outbox
+        if outbox:
+            self._flush()
+            if outbox:
+                return False
+        outbox += message
+        self._flush()
+        return True
+
+    def _flush(self):
+        try:
+            sent = self.sock.send(self._outbox)
+        except BlockingIOError:
+            return
+        del self._outbox[:sent]
+
+    def _receive(self, step):
+        """Return the move records answering ``step``, or None if late"""
+        end = None if self.deadline is None else time.perf_counter() + self.deadline
+        while True:
+            moves = self._take(step)
+            if moves is not None:
+                return moves
+            if end is not None:
+                remaining = end - time.perf_counter()
+                if (
+                    remaining <= 0
+                    or not select.select((self.sock,), (), (), remaining)[0]
+                ):
+                    self.late += 1
+                    return None
+            try:
+                data = self.sock.recv(RECV_SIZE)
+            except BlockingIOError:
+                continue
+            if not data:
+                raise ConnectionResetError("Bot closed the connection")
+            self._inbox += data
+
+    def _take(self, step):
+        """Consume buffered replies; return the records of ``step`` if present
+
+        Replies to earlier steps arrived after their deadline and are dropped.
+        """
+        inbox = self._inbox
+        while len(inbox) >= HEADER.size:
+            kind, version, count, reply_step = HEADER.unpack_from(inbox)
+            if kind != MOVES or version != BOT_VERSION:
+                raise ConnectionResetError("Bot sent an invalid message")
+            end = HEADER.size + count * MOVE.size
+            if len(inbox) < end:
+                return None
+            moves = bytes(inbox[HEADER.size : end])
+            del inbox[:end]
+            if reply_step == step:
+                return moves
+        return None
+
+    def _close(self):
+        print("Warning: Lost the bot connection, the built-in AI takes over")
+        self.closed = True
+        self.sock.close()
+
+    def close(self):
+        """Close the connection to the bot"""
+        if not self.closed:
+            self.closed = True
+            self.sock.close()
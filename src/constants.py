@@ -1,6 +1,14 @@
 import pygame
 
-# Initialize Pygame
+# Mixer format; the asset bundle stores sound data already converted to it
+MIXER_FREQUENCY = 22050
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512
+
+# Initialize Pygame; pygame.init() also starts the mixer, so set its format
+# first or SoundManager (and the asset bundle) would get the default format
+pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
 pygame.init()
 
 # Constants
@@ -12,6 +20,16 @@ BALL_SIZE = 15
 PADDLE_SPEED = 5
 BALL_SPEED = 5
 
+# Ticks per second of the simulation thread (--threaded)
+SIMULATION_RATE = 60
+
+# Multi-ball chaos mode
+GRID_CELL_SIZE = 40  # Broadphase cell size in pixels
+SPAWN_BAND_WIDTH = 400  # Balls respawn anywhere this wide around the center line
+
+# Particle effects
+MAX_PARTICLES = 512  # Fixed pool size; bounds per-frame particle cost
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
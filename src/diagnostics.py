@@ -0,0 +1,176 @@
+import gc
+import time
+import tracemalloc
+
+# Frame states reported by Game.frame_state()
+FRAME_STATES = ("menu", "playing", "paused", "game_over")
+
+
+class FrameDiagnostics:
+    """Per-frame allocation and garbage collector report for the main loop
+
+    tracemalloc records every allocation, but snapshots are only taken every
+    ``sample_every`` frames: each snapshot is diffed against the previous one
+    and the growth per call site is divided by the frames in between. Windows
+    that span a change of frame state are discarded, so the report can be
+    broken down by state. Memory that is allocated and freed within a frame
+    never shows up in a diff, so the traced-memory peak is also reset every
+    frame to measure the transient high-water mark. The garbage collector is
+    watched through ``gc.callbacks`` for collection counts and pause durations.
+    """
+
+    def __init__(self, sample_every=120, top=10, nframe=1):
+        self.sample_every = sample_every
+        self.top = top
+        tracemalloc.start(nframe)
+        self._filters = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+        # state -> {call site: [bytes, blocks]} and state -> sampled frames
+        self.sites = {state: {} for state in FRAME_STATES}
+        self.sampled_frames = dict.fromkeys(FRAME_STATES, 0)
+        self.frames = dict.fromkeys(FRAME_STATES, 0)
+        self.transient_total = dict.fromkeys(FRAME_STATES, 0)
+        self.transient_max = dict.fromkeys(FRAME_STATES, 0)
+        self._frame_start_memory = tracemalloc.get_traced_memory()[0]
+        self.gc_collections = [0, 0, 0]
+        self.gc_pause_total = [0.0, 0.0, 0.0]
+        self.gc_pause_max = [0.0, 0.0, 0.0]
+        self.gc_pauses_by_state = dict.fromkeys(FRAME_STATES, 0)
+        self._gc_start = 0.0
+        self._state = None
+        self._window_frames = 0
+        # Filtering compiles and caches patterns; do it once so that warm-up
+        # does not show up as allocations in the first sampling window
+        self._snapshot = self._take_snapshot()
+        gc.callbacks.append(self._on_gc)
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+            return
+        pause = time.perf_counter() - self._gc_start
+        generation = info["generation"]
+        self.gc_collections[generation] += 1
+        self.gc_pause_total[generation] += pause
+        self.gc_pause_max[generation] = max(self.gc_pause_max[generation], pause)
+        if self._state is not None:
+            self.gc_pauses_by_state[self._state] += 1
+
+    def end_frame(self, state):
+        """Call once at the end of every frame with Game.frame_state()"""
+        self.frames[state] += 1
+        current, peak = tracemalloc.get_traced_memory()
+        transient = peak - self._frame_start_memory
+        self.transient_total[state] += transient
+        self.transient_max[state] = max(self.transient_max[state], transient)
+        if state != self._state:
+            # Start a fresh sampling window for the new state
+            self._state = state
+            self._window_frames = 0
+            self._snapshot = self._take_snapshot()
+        else:
+            self._window_frames += 1
+            if self._window_frames >= self.sample_every:
+                self._sample(state)
+        self._start_next_frame()
+
+    def _sample(self, state):
+        """Diff a new snapshot against the previous one and credit call sites"""
+        snapshot = self._take_snapshot()
+        sites = self.sites[state]
+        for stat in snapshot.compare_to(self._snapshot, "lineno"):
+            if stat.count_diff > 0:
+                frame = stat.traceback[0]
+                site = f"{frame.filename}:{frame.lineno}"
+                totals = sites.setdefault(site, [0, 0])
+                totals[0] += stat.size_diff
+                totals[1] += stat.count_diff
+        self.sampled_frames[state] += self._window_frames
+        self._window_frames = 0
+        self._snapshot = snapshot
+
+    def _start_next_frame(self):
+        tracemalloc.reset_peak()
+        self._frame_start_memory = tracemalloc.get_traced_memory()[0]
+
+    def report(self):
+        """Return the report as a printable string"""
+        lines = ["Frame diagnostics"]
+        for state in FRAME_STATES:
+            sampled = self.sampled_frames[state]
+            if not self.frames[state]:
+                continue
+            lines.append(
+                f"  {state}: {self.frames[state]} frames, {sampled} sampled, "
+                f"{self.gc_pauses_by_state[state]} GC pauses, transient "
+                f"{self.transient_total[state] / self.frames[state]:.0f} B/frame "
+                f"(max {self.transient_max[state]} B)"
+            )
+            if not sampled:
+                continue
+            sites = sorted(
+                self.sites[state].items(), key=lambda item: item[1][1], reverse=True
+            )
+            if not sites:
+                lines.append("    no allocations retained across frames")
+            for site, (size, count) in sites[: self.top]:
+                lines.append(
+                    f"    {count / sampled:8.2f} blocks/frame "
+                    f"{size / sampled:10.1f} B/frame  {site}"
+                )
+        for generation in range(3):
+            count = self.gc_collections[generation]
+            mean = self.gc_pause_total[generation] / count if count else 0.0
+            lines.append(
+                f"  gen{generation}: {count} collections, "
+                f"mean pause {mean * 1000:.3f} ms, "
+                f"max pause {self.gc_pause_max[generation] * 1000:.3f} ms"
+            )
+        return "\n".join(lines)
+
+    def close(self):
+        """Stop tracing and detach from the garbage collector"""
+        gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
+
+
+class GCController:
+    """Keeps cyclic garbage collection out of gameplay frames
+
+    ``start`` collects once and freezes everything allocated during startup
+    (fonts, surfaces, game objects) so the collector never scans it again,
+    then disables automatic collection. While playing no collection runs
+    unless the youngest generation grows past ``emergency_threshold``; the
+    deferred work happens in one full collection when the game enters the
+    menu, the pause screen or the game over screen.
+    """
+
+    def __init__(self, emergency_threshold=50000):
+        self.emergency_threshold = emergency_threshold
+        self._was_playing = False
+
+    def start(self):
+        """Freeze startup objects and take over from automatic collection"""
+        gc.collect()
+        gc.freeze()
+        gc.disable()
+
+    def frame(self, playing):
+        """Call once per frame; ``playing`` is True while gameplay runs"""
+        if playing:
+            if gc.get_count()[0] > self.emergency_threshold:
+                gc.collect(0)
+        elif self._was_playing:
+            # Just left gameplay: a good moment for a full collection
+            gc.collect()
+        self._was_playing = playing
+
+    def stop(self):
+        """Hand collection back to the interpreter"""
+        gc.enable()
+        gc.unfreeze()
@@ -0,0 +1,183 @@
+import pygame
+from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK
+
+# Dirty regions are widened to this grid (in logical pixels) before scaling,
+# which keeps the number of separate regions per frame small
+TILE_SIZE = 16
+
+# Fullscreen low-resolution mode runs the screen at 1/LOW_RES_DIVISOR of the
+# desktop resolution in each direction
+LOW_RES_DIVISOR = 2
+
+# Past this share of the frame, one full-frame scale beats many small ones
+FULL_FRAME_SHARE = 0.5
+
+
+class Display:
+    """Window showing the fixed WINDOW_WIDTH x WINDOW_HEIGHT frame at any size
+
+    The game always draws to ``surface`` in logical coordinates. ``present``
+    scales the frame to the largest centered viewport with the logical aspect
+    ratio (black bars fill the rest), and only rescales the regions the game
+    reports as dirty, so gameplay frames scale a few small rectangles instead
+    of the whole window. The window is resizable; ``to_logical`` maps window
+    positions such as mouse coordinates back to the logical frame.
+
+    ``low_res`` (fullscreen only) switches the screen to half the desktop
+    resolution, so a 4K display is fed 1920x1080 frames that the monitor
+    scales up, a quarter of the pixels to scale in software.
+    """
+
+    def __init__(self, size=None, fullscreen=False, low_res=False):
+        self.fullscreen = fullscreen
+        self.low_res = low_res
+        self.surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.logical = self.surface.get_rect()
+        if fullscreen:
+            width, height = pygame.display.get_desktop_sizes()[0]
+            if low_res:
+                width //= LOW_RES_DIVISOR
+                height //= LOW_RES_DIVISOR
+            self.window = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
+        else:
+            self.window = pygame.display.set_mode(
+                size or (WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE
+            )
+        self.surface = self.surface.convert(self.window)
+        # Logical regions and their window rects, reused from frame to frame
+        self._region_rects = [pygame.Rect(0, 0, 0, 0)]
+        self._updated_rects = []
+        self._merge_rect = pygame.Rect(0, 0, 0, 0)
+        self._layout()
+
+    def _layout(self):
+        """Fit the viewport to the current window size"""
+        width, height = self.window.get_size()
+        self.scale = min(width / WINDOW_WIDTH, height / WINDOW_HEIGHT)
+        viewport_width = round(WINDOW_WIDTH * self.scale)
+        viewport_height = round(WINDOW_HEIGHT * self.scale)
+        self.viewport = pygame.Rect(
+            (width - viewport_width) // 2,
+            (height - viewport_height) // 2,
+            viewport_width,
+            viewport_height,
+        )
+        self.window.fill(BLACK)
+        self._full_frame = True
+
+    def handle_event(self, event):
+        """Follow window resizes; the next frame is presented in full"""
+        if event.type == pygame.VIDEORESIZE:
+            # pygame 2 resizes the display surface itself
+            self.window = pygame.display.get_surface()
+            self._layout()
+        elif event.type == pygame.VIDEOEXPOSE:
+            self._full_frame = True
+
+    def to_logical(self, pos):
+        """Map a window position to logical coordinates, clamped to the frame"""
+        viewport = self.viewport
+        x = int((pos[0] - viewport.x) / self.scale)
+        y = int((pos[1] - viewport.y) / self.scale)
+        return (
+            min(max(x, 0), WINDOW_WIDTH - 1),
+            min(max(y, 0), WINDOW_HEIGHT - 1),
+        )
+
+    def _to_window(self, rect, target):
+        """Set ``target`` to the window rect the logical ``rect`` scales to"""
+        viewport = self.viewport
+        scale = self.scale
+        left = viewport.x + round(rect.left * scale)
+        top = viewport.y + round(rect.top * scale)
+        target.update(
+            left,
+            top,
+            viewport.x + round(rect.right * scale) - left,
+            viewport.y + round(rect.bottom * scale) - top,
+        )
+
+    def _regions(self, dirty):
+        """Gather non-overlapping logical rects to rescale for ``dirty``
+
+        Each region is scaled on its own, which can sample a logical pixel's
+        neighbour for the window pixels along its edges. Regions reach one
+        pixel past the tiles they cover, so every window pixel that may show
+        a changed logical pixel is repainted. The regions are the first of
+        the returned count entries of ``self._region_rects``, Rects reused
+        from frame to frame.
+        """
+        regions = self._region_rects
+        rect = self._merge_rect
+        count = 0
+        for dirty_rect in dirty:
+            # Clip to the frame, then widen to the tile grid plus one pixel
+            left = max(dirty_rect.left, 0)
+            top = max(dirty_rect.top, 0)
+            right = min(dirty_rect.right, WINDOW_WIDTH)
+            bottom = min(dirty_rect.bottom, WINDOW_HEIGHT)
+            if right <= left or bottom <= top:
+                continue
+            left = max(left // TILE_SIZE * TILE_SIZE - 1, 0)
+            top = max(top // TILE_SIZE * TILE_SIZE - 1, 0)
+            right = min(-(-right // TILE_SIZE) * TILE_SIZE + 1, WINDOW_WIDTH)
+            bottom = min(-(-bottom // TILE_SIZE) * TILE_SIZE + 1, WINDOW_HEIGHT)
+            rect.update(left, top, right - left, bottom - top)
+            # Merge with whatever it overlaps, repeatedly, as the union grows
+            index = 0
+            while index < count:
+                region = regions[index]
+                if rect.colliderect(region):
+                    rect.union_ip(region)
+                    count -= 1
+                    regions[index] = regions[count]
+                    regions[count] = region
+                    index = 0
+                else:
+                    index += 1
+            if count == len(regions):
+                regions.append(pygame.Rect(0, 0, 0, 0))
+            regions[count].update(rect)
+            count += 1
+        return count
+
+    def present(self, dirty=None):
+        """Show the frame; ``dirty`` lists the logical rects that changed
+
+        Without ``dirty`` (or after a resize) the whole frame is presented.
+        """
+        regions = self._region_rects
+        full = dirty is None or self._full_frame
+        if not full:
+            count = self._regions(dirty)
+            area = 0
+            for index in range(count):
+                region = regions[index]
+                area += region.w * region.h
+            full = area > FULL_FRAME_SHARE * WINDOW_WIDTH * WINDOW_HEIGHT
+        if full:
+            regions[0].update(self.logical)
+            count = 1
+        surface = self.surface
+        window = self.window
+        updated = self._updated_rects
+        for index in range(count):
+            rect = regions[index]
+            if index == len(updated):
+                updated.append(pygame.Rect(0, 0, 0, 0))
+            target = updated[index]
+            self._to_window(rect, target)
+            if target.w == rect.w and target.h == rect.h:
+                window.blit(surface, target, rect)
+            else:
+                pygame.transform.scale(
+                    surface.subsurface(rect), target.size, window.subsurface(target)
+                )
+        # Entries past count are left over from earlier frames
+        for index in range(count, len(updated)):
+            updated[index].w = 0
+        if self._full_frame:
+            self._full_frame = False
+            pygame.display.flip()
+        else:
+            pygame.display.update(updated)
@@ -0,0 +1,72 @@
+import inspect
+
+# Every game event and the arguments its handlers are called with
+EVENTS = {
+    # Start and end of every Game.update
+    "tick_start": (),
+    "tick_end": (),
+    # A match began (left the start menu) / the game went back to the menu
+    "start": (),
+    "reset": (),
+    # Ball bounced off the top or bottom wall at (x, y)
+    "wall_hit": ("x", "y"),
+    # Ball hit the "player" or "ai" paddle at (x, y); ``offset`` is where it
+    # landed on the paddle, -1 (top edge) to 1 (bottom edge)
+    "paddle_hit": ("side", "x", "y", "offset"),
+    # Ball left the field at height ``y``; ``scorer`` is "player" or "ai"
+    "goal": ("scorer", "y"),
+    "pause": (),
+    "resume": (),
+    # ``winner`` is "player" or "ai"
+    "game_over": ("winner", "player_score", "ai_score"),
+}
+
+
+class GameEvents:
+    """Hooks for game events that sound, effects, telemetry and plugins use
+
+    Each event is an attribute holding a tuple of handlers, rebuilt whenever a
+    handler is added or removed. Game dispatches by looping over that tuple
+    directly, so an event with no subscribers costs one attribute lookup and
+    an empty loop, and handlers may (un)subscribe while an event is dispatched.
+    """
+
+    __slots__ = tuple(EVENTS)
+
+    def __init__(self):
+        for event in EVENTS:
+            setattr(self, event, ())
+
+    def subscribe(self, event, handler):
+        """Call ``handler`` on every ``event``; returns the handler
+
+        Raises ValueError for unknown events and TypeError if the handler
+        cannot take the event's arguments.
+        """
+        if event not in EVENTS:
+            raise ValueError(f"Unknown game event: {event}")
+        try:
+            signature = inspect.signature(handler)
+        except (TypeError, ValueError):
+            signature = None  # Some builtins do not expose a signature
+        if signature is not None:
+            try:
+                signature.bind(*EVENTS[event])
+            except TypeError:
+                raise TypeError(
+                    f"Handler {handler!r} for {event} must accept "
+                    f"({', '.join(EVENTS[event])})"
+                ) from None
+        setattr(self, event, getattr(self, event) + (handler,))
+        return handler
+
+    def unsubscribe(self, event, handler):
+        """Stop calling ``handler`` on ``event``"""
+        handlers = list(getattr(self, event))
+        handlers.remove(handler)
+        setattr(self, event, tuple(handlers))
+
+    def emit(self, event, *args):
+        """Call every handler of ``event`` (for code off the hot path)"""
+        for handler in getattr(self, event):
+            handler(*args)
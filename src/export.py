@@ -0,0 +1,158 @@
+import math
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Game (and with it pygame's display) is imported lazily: worker processes
+# must select the dummy video driver before src.constants opens a window
+
+FORMATS = ("png", "raw")
+
+# Per-process Game used by render workers
+_worker_game = None
+
+
+def capture_state(game):
+    """Return everything Game.render needs for one frame as picklable data"""
+    particles = game.particles
+    count = particles.count
+    return (
+        game.ball.rect.x,
+        game.ball.rect.y,
+        game.player_paddle.rect.y,
+        game.ai_paddle.rect.y,
+        game.player_score,
+        game.ai_score,
+        game.game_over,
+        game.game_winner,
+        particles.x[:count],
+        particles.y[:count],
+        particles.life[:count],
+        particles.max_life[:count],
+        particles.kind[:count],
+    )
+
+
+def apply_state(game, state):
+    """Load a state from capture_state into ``game`` for rendering"""
+    (
+        game.ball.rect.x,
+        game.ball.rect.y,
+        game.player_paddle.rect.y,
+        game.ai_paddle.rect.y,
+        game.player_score,
+        game.ai_score,
+        game.game_over,
+        game.game_winner,
+        xs,
+        ys,
+        life,
+        max_life,
+        kind,
+    ) = state
+    particles = game.particles
+    count = len(xs)
+    particles.count = count
+    particles.x[:count] = xs
+    particles.y[:count] = ys
+    particles.life[:count] = life
+    particles.max_life[:count] = max_life
+    particles.kind[:count] = kind
+
+
+def simulate_states(replay, start=0, end=None):
+    """Re-simulate a replay and capture the states of ticks [start, end)"""
+    from .game import Game
+    from .replay import replay_ticks
+
+    game = Game()
+    states = []
+    for tick in replay_ticks(game, replay):
+        if end is not None and tick >= end:
+            break
+        if tick >= start:
+            states.append(capture_state(game))
+    return states
+
+
+def _init_worker():
+    global _worker_game
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from .constants import WINDOW_WIDTH, WINDOW_HEIGHT
+    from .game import Game
+
+    _worker_game = Game()
+    _worker_game.screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+
+def _render_range(job):
+    """Render one contiguous range of frames; returns the frame count"""
+    import pygame
+
+    first, states, output, fmt, first_tick = job
+    game = _worker_game
+    surface = game.screen
+    if fmt == "png":
+        for offset, state in enumerate(states):
+            apply_state(game, state)
+            game.render()
+            tick = first_tick + first + offset
+            frame_path = os.path.join(output, f"frame_{tick:06d}.png")
+            pygame.image.save(surface, frame_path)
+    else:
+        # Each range goes to its own part file; the parent joins them in order
+        with open(_part_path(output, first), "wb") as part:
+            for state in states:
+                apply_state(game, state)
+                game.render()
+                part.write(pygame.image.tobytes(surface, "RGB"))
+    return len(states)
+
+
+def _part_path(output, first):
+    return f"{output}.part{first:06d}"
+
+
+def export_states(states, output, fmt="png", workers=None, first_tick=0):
+    """Render captured states to a PNG sequence or raw RGB stream in parallel
+
+    Frames are split into contiguous ranges that a process pool renders
+    concurrently. PNG frames are numbered by tick, ``states[0]`` being tick
+    ``first_tick``; raw ranges are written to part files and concatenated in
+    order, so the output order always matches the simulation.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    workers = workers or os.cpu_count() or 1
+    # A few ranges per worker keeps the pool busy when frames differ in cost
+    chunk = max(1, math.ceil(len(states) / (workers * 4)))
+    jobs = [
+        (first, states[first : first + chunk], output, fmt, first_tick)
+        for first in range(0, len(states), chunk)
+    ]
+    if fmt == "png":
+        os.makedirs(output, exist_ok=True)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, context, _init_worker) as pool:
+        rendered = sum(pool.map(_render_range, jobs))
+    if fmt == "raw":
+        with open(output, "wb") as stream:
+            for first, _, _, _, _ in jobs:
+                with open(_part_path(output, first), "rb") as part:
+                    shutil.copyfileobj(part, stream)
+                os.remove(_part_path(output, first))
+    return rendered
+
+
+def export_replay(replay, output, fmt="png", workers=None, start=0, end=None):
+    """Simulate a replay, then render it in parallel; returns timing in seconds"""
+    started = time.perf_counter()
+    states = simulate_states(replay, start, end)
+    simulated = time.perf_counter()
+    frames = export_states(states, output, fmt, workers, start)
+    finished = time.perf_counter()
+    return frames, simulated - started, finished - simulated
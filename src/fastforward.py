@@ -0,0 +1,116 @@
+from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, BALL_SIZE, PADDLE_WIDTH
+
+# Quiet-tick count when the ball moves neither towards a wall nor sideways
+_FOREVER = 1 << 62
+
+
+class FastForward:
+    """Event-driven simulation of a single-ball Game for headless batch runs
+
+    Between events the ball flies in a straight line, so the number of ticks
+    until the next wall contact, the next paddle's x range or the edge of the
+    field is computed analytically. Those quiet ticks are applied in one jump
+    (AIPaddle.skip_ticks covers the paddles), and the eventful tick itself
+    runs through Game.update, so scores, positions, velocities and the random
+    generator end up exactly where tick-by-tick Game.update leaves them.
+
+    Work that happens on every tick is not repeated for skipped ticks: the
+    ``tick_start``/``tick_end`` hooks and match recording. Particle effects
+    are dropped on every skip; nothing draws them in a headless run.
+    """
+
+    def __init__(self, game):
+        if game.ball_store is not None:
+            raise ValueError("Fast-forward needs single-ball mode")
+        self.game = game
+        self.ticks = 0
+        self.skipped = 0
+        self.paddle_xs = (game.player_paddle.rect.x, game.ai_paddle.rect.x)
+
+    def _x_eventful(self, x):
+        """True if a ball at ``x`` may touch a paddle or has left the field"""
+        if x + BALL_SIZE < 0 or x > WINDOW_WIDTH:
+            return True
+        for paddle_x in self.paddle_xs:
+            if paddle_x - BALL_SIZE < x < paddle_x + PADDLE_WIDTH:
+                return True
+        return False
+
+    def quiet_ticks(self):
+        """Return how many upcoming ticks only move the ball in a straight line"""
+        ball = self.game.ball
+        rect = ball.rect
+        x, y = rect.x, rect.y
+        vx = ball.velocity_x
+        # A ball at or past a wall bounces on the next tick, or is caught in it
+        if y <= 0 or y >= WINDOW_HEIGHT - BALL_SIZE or self._x_eventful(x):
+            return 0
+        # Fractional velocities are rounded by Rect, the same way every tick
+        probe = rect.copy()
+        probe.y += ball.velocity_y
+        dy = probe.y - y
+
+        # Ticks until the ball touches the top or bottom wall
+        if dy > 0:
+            wall = -(-(WINDOW_HEIGHT - BALL_SIZE - y) // dy)
+        elif dy < 0:
+            wall = -(-y // -dy)
+        else:
+            wall = _FOREVER
+
+        # Ticks until the ball reaches a paddle's x range or leaves the field
+        if vx > 0:
+            ahead = [
+                paddle_x - BALL_SIZE + 1
+                for paddle_x in self.paddle_xs
+                if paddle_x - BALL_SIZE >= x
+            ]
+            limit = min(ahead + [WINDOW_WIDTH + 1])
+            edge = -(-(limit - x) // vx)
+        elif vx < 0:
+            ahead = [
+                paddle_x + PADDLE_WIDTH - 1
+                for paddle_x in self.paddle_xs
+                if paddle_x + PADDLE_WIDTH <= x
+            ]
+            limit = max(ahead + [-BALL_SIZE - 1])
+            edge = -(-(x - limit) // -vx)
+        else:
+            edge = _FOREVER
+        return max(0, min(wall, edge) - 1)
+
+    def _skip(self, ticks):
+        """Apply ``ticks`` quiet ticks in one step"""
+        game = self.game
+        ball = game.ball
+        rect = ball.rect
+        probe = rect.copy()
+        probe.y += ball.velocity_y
+        dy = probe.y - rect.y
+        vx = ball.velocity_x
+        centery = rect.centery
+        # Game.update moves the right AI before the left one
+        game.ai_paddle.skip_ticks(ticks, vx > 0, centery, dy)
+        if game.ai_vs_ai:
+            game.player_paddle.skip_ticks(ticks, vx < 0, centery, dy)
+        rect.x += ticks * vx
+        rect.y += ticks * dy
+        game.particles.clear()
+        self.skipped += ticks
+
+    def advance(self, ticks):
+        """Simulate up to ``ticks`` ticks, stopping early at game over
+
+        Returns the number of ticks simulated.
+        """
+        game = self.game
+        done = 0
+        while done < ticks and not game.game_over:
+            skip = min(self.quiet_ticks(), ticks - done - 1)
+            if skip > 0:
+                self._skip(skip)
+                done += skip
+            game.update()
+            done += 1
+        self.ticks += done
+        return done
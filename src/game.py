@@ -4,6 +4,7 @@ from .constants import (
     WINDOW_HEIGHT,
     PADDLE_HEIGHT,
     PADDLE_WIDTH,
+    BALL_SIZE,
     screen,
     clock,
     WHITE,
@@ -14,25 +15,73 @@ from .constants import (
 from .paddle import Paddle
 from .ai_paddle import AIPaddle
 from .ball import Ball
-from .sounds import SoundManager
+from .balls import BallStore
+from .events import GameEvents
+from .particles import ParticleSystem
+from .sounds import shared_sound_manager
+
+# Rects per frame in Game.dirty_rects: paddles, ball, two scores, particles
+DIRTY_RECTS = 6
 
 
 class Game:
-    def __init__(self):
+    def __init__(
+        self,
+        multiball=0,
+        ball_collisions=False,
+        telemetry=None,
+        diagnostics=None,
+        gc_controller=None,
+        recorder=None,
+        ai_vs_ai=False,
+        display=None,
+    ):
         self.speed_multiplier = 1.0
         self.ai_difficulty = "medium"  # easy, medium, hard
-        # Initialize sound manager
-        self.sound_manager = SoundManager()
-        self.player_paddle = Paddle(
-            50, WINDOW_HEIGHT // 2 - PADDLE_HEIGHT // 2, self.speed_multiplier
-        )
+        # Sounds are loaded once per process and shared between games
+        self.sound_manager = shared_sound_manager()
+        # In AI-vs-AI mode a second AI plays the left paddle instead of the mouse
+        self.ai_vs_ai = ai_vs_ai
+        if ai_vs_ai:
+            self.player_paddle = AIPaddle(
+                50,
+                WINDOW_HEIGHT // 2 - PADDLE_HEIGHT // 2,
+                self.speed_multiplier,
+                self.ai_difficulty,
+                direction=-1,
+            )
+        else:
+            self.player_paddle = Paddle(
+                50, WINDOW_HEIGHT // 2 - PADDLE_HEIGHT // 2, self.speed_multiplier
+            )
         self.ai_paddle = AIPaddle(
             WINDOW_WIDTH - 50 - PADDLE_WIDTH,
             WINDOW_HEIGHT // 2 - PADDLE_HEIGHT // 2,
             self.speed_multiplier,
             self.ai_difficulty,
         )
-        self.ball = Ball(self.speed_multiplier, self.sound_manager)
+        self.ball = Ball(self.speed_multiplier)
+        # Multi-ball chaos mode replaces the single ball with an array-backed store
+        self.ball_store = None
+        if multiball > 0:
+            self.ball_store = BallStore(
+                multiball, self.speed_multiplier, ball_collisions
+            )
+        self.particles = ParticleSystem()
+        # Optional MatchTelemetry recorder (see src/telemetry.py)
+        self.telemetry = telemetry
+        # Event hooks (see src/events.py); sounds, effects and telemetry
+        # subscribe like any plugin would
+        self.events = GameEvents()
+        self.sound_manager.subscribe(self.events, WINDOW_WIDTH)
+        self.particles.subscribe(self.events)
+        if telemetry is not None:
+            telemetry.subscribe(self.events, self)
+        # Optional FrameDiagnostics and GCController (see src/diagnostics.py)
+        self.diagnostics = diagnostics
+        self.gc_controller = gc_controller
+        # Optional MatchRecorder (see src/replay.py)
+        self.recorder = recorder
         self.player_score = 0
         self.ai_score = 0
         self.paused = False
@@ -47,23 +96,58 @@ class Game:
         self.max_score_input = ""
         self.game_over = False
         self.game_winner = None
-        self.menu_button_rect = None
+        # Return to menu button on the pause screen
+        button_width = 250
+        button_height = 40
+        button_x = (WINDOW_WIDTH - button_width) // 2
+        button_y = WINDOW_HEIGHT // 2 + 190
+        self.menu_button_rect = pygame.Rect(
+            button_x, button_y, button_width, button_height
+        )
+        # Optional Display that scales the frame to the window (see
+        # src/display.py); without one the frame goes straight to the window
+        self.display = display
+        # Surface all drawing goes to; an off-screen Surface for headless export
+        self.screen = display.surface if display is not None else screen
+        # What the last two frames drew where, for dirty_rects: one half of
+        # the list per frame, rewritten in place so play allocates nothing
+        self._dirty = [pygame.Rect(0, 0, 0, 0) for _ in range(2 * DIRTY_RECTS)]
+        self._dirty_half = 0
+        self._dirty_valid = False
+        # Surfaces reused every frame instead of being re-created
+        self.background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.background.fill(BLACK)
+        for y in range(0, WINDOW_HEIGHT, 20):
+            pygame.draw.rect(self.background, WHITE, (WINDOW_WIDTH // 2 - 5, y, 10, 10))
+        self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.overlay.fill(BLACK)
+        self.score_surfaces = {}
+        self.player_score_pos = (WINDOW_WIDTH // 4, 50)
+        self.ai_score_pos = (3 * WINDOW_WIDTH // 4, 50)
 
     def handle_input(self):
         """Handle mouse input"""
-        if not self.paused:
+        if not self.paused and not self.ai_vs_ai:
             # Mouse control - paddle follows mouse Y position
-            mouse_y = pygame.mouse.get_pos()[1]
+            mouse_y = self.mouse_position()[1]
             self.player_paddle.set_position(mouse_y)
 
     def adjust_speed(self, delta):
         """Adjust game speed multiplier"""
-        new_multiplier = max(0.5, min(3.0, self.speed_multiplier + delta))
+        self.set_speed(self.speed_multiplier + delta)
+
+    def set_speed(self, multiplier):
+        """Set game speed multiplier (clamped to 0.5x-3.0x)"""
+        new_multiplier = max(0.5, min(3.0, multiplier))
         if new_multiplier != self.speed_multiplier:
             self.speed_multiplier = new_multiplier
             self.player_paddle.update_speed(self.speed_multiplier)
             self.ai_paddle.update_speed(self.speed_multiplier)
             self.ball.update_speed(self.speed_multiplier)
+            if self.ball_store is not None:
+                self.ball_store.update_speed(self.speed_multiplier)
+            if self.recorder is not None:
+                self.recorder.settings_changed(self)
 
     def set_ai_difficulty(self, difficulty):
         """Set AI difficulty level"""
@@ -71,18 +155,47 @@ class Game:
             self.ai_difficulty = difficulty
             self.ai_paddle.set_difficulty(difficulty)
             self.ai_paddle.update_speed(self.speed_multiplier)
+            if self.ai_vs_ai:
+                self.player_paddle.set_difficulty(difficulty)
+                self.player_paddle.update_speed(self.speed_multiplier)
+            if self.recorder is not None:
+                self.recorder.settings_changed(self)
 
     def cycle_ai_difficulty(self):
         """Cycle through AI difficulty levels"""
         difficulties = ["easy", "medium", "hard"]
         current_index = difficulties.index(self.ai_difficulty)
         next_index = (current_index + 1) % len(difficulties)
-        self.ai_difficulty = difficulties[next_index]
-        self.ai_paddle.set_difficulty(self.ai_difficulty)
-        self.ai_paddle.update_speed(self.speed_multiplier)
+        self.set_ai_difficulty(difficulties[next_index])
+
+    def frame_state(self):
+        """Return which screen the current frame shows"""
+        if not self.game_started:
+            return "menu"
+        if self.game_over:
+            return "game_over"
+        if self.paused:
+            return "paused"
+        return "playing"
+
+    def start_match(self):
+        """Leave the start menu and begin a match"""
+        self.game_started = True
+        if self.recorder is not None:
+            self.recorder.start_match(self)
+        if self.telemetry is not None:
+            self.telemetry.start_match(
+                self.speed_multiplier, self.ai_difficulty, self.max_score
+            )
+        self.events.emit("start")
 
     def reset_to_menu(self):
         """Reset game state and return to main menu"""
+        if self.telemetry is not None and not self.game_over:
+            # Leaving mid-match abandons it
+            self.telemetry.end_match(None, self.player_score, self.ai_score)
+        if self.recorder is not None:
+            self.recorder.end_match(self)
         self.player_score = 0
         self.ai_score = 0
         self.paused = False
@@ -90,40 +203,136 @@ class Game:
         self.game_over = False
         self.game_winner = None
         self.ball.reset()
+        if self.ball_store is not None:
+            self.ball_store.reset()
+        self.particles.clear()
         # Reset paddles to center
-        self.player_paddle.set_position(WINDOW_HEIGHT // 2)
+        self.player_paddle.rect.centery = WINDOW_HEIGHT // 2
         self.ai_paddle.rect.centery = WINDOW_HEIGHT // 2
+        self.events.emit("reset")
 
     def update(self):
         """Update game state"""
-        self.ball.update()
-        self.ai_paddle.update(self.ball)
+        if self.recorder is not None:
+            self.recorder.tick(self)
+        if self.ball_store is not None:
+            self.update_multiball()
+            return
+
+        events = self.events
+        for handler in events.tick_start:
+            handler()
+        particles = self.particles
+        particles.update()
+        ball = self.ball
+        if ball.update():
+            for handler in events.wall_hit:
+                handler(ball.rect.centerx, ball.rect.centery)
+        self.ai_paddle.update(ball)
+        if self.ai_vs_ai:
+            self.player_paddle.update(ball)
 
         # Check collisions
-        self.ball.check_collision(self.player_paddle)
-        self.ball.check_collision(self.ai_paddle)
+        if ball.check_collision(self.player_paddle):
+            for handler in events.paddle_hit:
+                handler(
+                    "player", ball.rect.left, ball.rect.centery, ball.last_hit_offset
+                )
+        if ball.check_collision(self.ai_paddle):
+            for handler in events.paddle_hit:
+                handler(
+                    "ai", ball.rect.right, ball.rect.centery, ball.last_hit_offset
+                )
+        particles.spawn_trail(ball.rect.centerx, ball.rect.centery)
 
         # Check for scoring
-        if self.ball.is_out_of_bounds():
-            if self.ball.rect.right < 0:
+        if ball.is_out_of_bounds():
+            if ball.rect.right < 0:
                 self.ai_score += 1
+                scorer = "ai"
             else:
                 self.player_score += 1
-            # Play goal scored sound
-            self.sound_manager.play_goal_scored()
+                scorer = "player"
+            for handler in events.goal:
+                handler(scorer, ball.rect.centery)
             self.ball.reset()
-
-            # Check win condition
-            if self.max_score is not None:
-                if self.player_score >= self.max_score:
-                    self.game_over = True
-                    self.game_winner = "player"
-                elif self.ai_score >= self.max_score:
-                    self.game_over = True
-                    self.game_winner = "ai"
+            self.check_win_condition()
+        for handler in events.tick_end:
+            handler()
+
+    def update_multiball(self):
+        """Update game state in multi-ball chaos mode
+
+        Each event fires at most once per tick (goals once per scoring side),
+        describing the last ball involved.
+        """
+        events = self.events
+        for handler in events.tick_start:
+            handler()
+        # Hits and goals throw effects as in single-ball mode; no ball trails
+        self.particles.update()
+        store = self.ball_store
+        wall_hit = store.update()
+        if wall_hit >= 0:
+            x = store.x[wall_hit] + BALL_SIZE // 2
+            y = store.y[wall_hit] + BALL_SIZE // 2
+            for handler in events.wall_hit:
+                handler(x, y)
+        self.ai_paddle.update(store.track(1))
+        if self.ai_vs_ai:
+            self.player_paddle.update(store.track(-1))
+        if store.check_collisions((self.player_paddle, self.ai_paddle)):
+            i = store.last_hit
+            # A ball bounced off the player paddle moves right afterwards
+            if store.vx[i] > 0:
+                side, x = "player", store.x[i]
+            else:
+                side, x = "ai", store.x[i] + BALL_SIZE
+            for handler in events.paddle_hit:
+                handler(side, x, store.y[i] + BALL_SIZE // 2, store.last_hit_offset)
+
+        # Several balls can score in the same tick
+        left_goals, right_goals = store.collect_goals()
+        if left_goals or right_goals:
+            self.ai_score += left_goals
+            self.player_score += right_goals
+            if left_goals:
+                for handler in events.goal:
+                    handler("ai", store.left_goal_y)
+            if right_goals:
+                for handler in events.goal:
+                    handler("player", store.right_goal_y)
+            self.check_win_condition()
+        for handler in events.tick_end:
+            handler()
+
+    def check_win_condition(self):
+        """End the game once either side reaches max_score"""
+        if self.max_score is not None:
+            if self.player_score >= self.max_score:
+                self.game_over = True
+                self.game_winner = "player"
+            elif self.ai_score >= self.max_score:
+                self.game_over = True
+                self.game_winner = "ai"
+            if self.game_over:
+                self.events.emit(
+                    "game_over", self.game_winner, self.player_score, self.ai_score
+                )
+            if self.game_over and self.recorder is not None:
+                self.recorder.end_match(self)
+
+    def score_surface(self, score):
+        """Return the rendered text for a score, rendering each value once"""
+        surface = self.score_surfaces.get(score)
+        if surface is None:
+            surface = self.font.render(str(score), True, WHITE)
+            self.score_surfaces[score] = surface
+        return surface
 
     def draw_start_menu(self):
         """Draw start menu for selecting speed and difficulty"""
+        screen = self.screen
         screen.fill(BLACK)
 
         # Draw title
@@ -216,15 +425,14 @@ class Game:
         )
         screen.blit(start_text, start_rect)
 
-        pygame.display.flip()
+        self.present()
 
     def draw_game_over(self):
         """Draw game over screen"""
+        screen = self.screen
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(200)  # Semi-transparent
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        self.overlay.set_alpha(200)  # Semi-transparent
+        screen.blit(self.overlay, (0, 0))
 
         # Draw background panel
         panel_width = 500
@@ -262,37 +470,91 @@ class Game:
         screen.blit(exit_text, exit_rect)
 
     def draw(self):
-        """Draw game elements"""
-        screen.fill(BLACK)
+        """Draw game elements and show them"""
+        self.render()
+        self.present()
+
+    def present(self):
+        """Show the frame drawn to self.screen"""
+        if self.display is not None:
+            self.display.present(self.dirty_rects())
+        else:
+            pygame.display.flip()
 
-        # Draw center line
-        for y in range(0, WINDOW_HEIGHT, 20):
-            pygame.draw.rect(screen, WHITE, (WINDOW_WIDTH // 2 - 5, y, 10, 10))
+    def dirty_rects(self):
+        """Return the areas that changed since the last frame, or None for all
+
+        During single-ball play only the paddles, the ball, the particles and
+        the scores change, at their old and new places; every other screen
+        is presented in full. The returned list and its Rects are reused, so
+        the next call overwrites them.
+        """
+        if self.frame_state() != "playing" or self.ball_store is not None:
+            self._dirty_valid = False
+            return None
+        rects = self._dirty
+        half = self._dirty_half = DIRTY_RECTS - self._dirty_half
+        rects[half].update(self.player_paddle.rect)
+        rects[half + 1].update(self.ai_paddle.rect)
+        rects[half + 2].update(self.ball.rect)
+        self._score_rect(rects[half + 3], self.player_score, self.player_score_pos)
+        self._score_rect(rects[half + 4], self.ai_score, self.ai_score_pos)
+        if self.particles.bounds(rects[half + 5]) is None:
+            rects[half + 5].w = 0
+        if not self._dirty_valid:
+            # Nothing to compare against yet
+            self._dirty_valid = True
+            return None
+        return rects
+
+    def _score_rect(self, rect, score, pos):
+        """Set ``rect`` to where ``score`` is drawn at ``pos``"""
+        surface = self.score_surface(score)
+        rect.topleft = pos
+        rect.w = surface.get_width()
+        rect.h = surface.get_height()
+
+    def to_logical(self, pos):
+        """Map a window position to game coordinates"""
+        if self.display is not None:
+            return self.display.to_logical(pos)
+        return pos
+
+    def mouse_position(self):
+        """Return the mouse position in game coordinates"""
+        return self.to_logical(pygame.mouse.get_pos())
+
+    def render(self):
+        """Draw game elements to self.screen without flipping the display"""
+        screen = self.screen
+        # Background with the center line already drawn on it
+        screen.blit(self.background, (0, 0))
+
+        # Draw particles underneath paddles and ball
+        self.particles.draw(screen)
 
         # Draw paddles and ball
         self.player_paddle.draw(screen)
         self.ai_paddle.draw(screen)
-        self.ball.draw(screen)
+        if self.ball_store is not None:
+            self.ball_store.draw(screen)
+        else:
+            self.ball.draw(screen)
 
         # Draw scores
-        player_text = self.font.render(str(self.player_score), True, WHITE)
-        ai_text = self.font.render(str(self.ai_score), True, WHITE)
-        screen.blit(player_text, (WINDOW_WIDTH // 4, 50))
-        screen.blit(ai_text, (3 * WINDOW_WIDTH // 4, 50))
+        screen.blit(self.score_surface(self.player_score), self.player_score_pos)
+        screen.blit(self.score_surface(self.ai_score), self.ai_score_pos)
 
         # Draw game over screen if game is over
         if self.game_over:
             self.draw_game_over()
-            pygame.display.flip()
             return
 
         # Draw pause message if paused
         if self.paused:
             # Draw semi-transparent overlay
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(180)  # Semi-transparent
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            self.overlay.set_alpha(180)  # Semi-transparent
+            screen.blit(self.overlay, (0, 0))
 
             # Draw background panel for settings
             panel_width = 450
@@ -375,17 +637,8 @@ class Game:
             )
             screen.blit(menu_instruction, menu_instruction_rect)
 
-            # Draw return to menu button
-            button_width = 250
-            button_height = 40
-            button_x = (WINDOW_WIDTH - button_width) // 2
-            button_y = WINDOW_HEIGHT // 2 + 190
-            self.menu_button_rect = pygame.Rect(
-                button_x, button_y, button_width, button_height
-            )
-
             # Check if mouse is hovering over button
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = self.mouse_position()
             button_hovered = self.menu_button_rect.collidepoint(mouse_pos)
 
             # Draw button with hover effect
@@ -410,127 +663,139 @@ class Game:
             )
             screen.blit(click_hint, click_hint_rect)
 
-        pygame.display.flip()
+    def handle_event(self, event):
+        """Handle one pygame event; returns False when the game should quit"""
+        running = True
+        if event.type == pygame.QUIT:
+            running = False
+        if self.display is not None:
+            self.display.handle_event(event)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left mouse button
+                if self.paused and self.menu_button_rect:
+                    pos = self.to_logical(event.pos)
+                    if self.menu_button_rect.collidepoint(pos):
+                        self.reset_to_menu()
+        if event.type == pygame.KEYDOWN:
+            if not self.game_started:
+                # Start menu controls
+                if (
+                    event.key == pygame.K_RETURN
+                    or event.key == pygame.K_KP_ENTER
+                ):
+                    # Validate and set max_score before starting
+                    if self.max_score_input:
+                        try:
+                            score = int(self.max_score_input)
+                            if 1 <= score <= 50:
+                                self.max_score = score
+                            else:
+                                # If invalid, use default
+                                self.max_score = 10
+                        except ValueError:
+                            self.max_score = 10
+                    else:
+                        # Default if no input
+                        self.max_score = 10
+                    self.start_match()
+                elif event.key == pygame.K_UP:
+                    self.adjust_speed(0.1)
+                elif event.key == pygame.K_DOWN:
+                    self.adjust_speed(-0.1)
+                elif event.key == pygame.K_a:
+                    self.cycle_ai_difficulty()
+                elif event.key == pygame.K_BACKSPACE:
+                    # Handle backspace to delete last character
+                    if self.max_score_input:
+                        self.max_score_input = self.max_score_input[:-1]
+                elif event.key in (
+                    pygame.K_0,
+                    pygame.K_1,
+                    pygame.K_2,
+                    pygame.K_3,
+                    pygame.K_4,
+                    pygame.K_5,
+                    pygame.K_6,
+                    pygame.K_7,
+                    pygame.K_8,
+                    pygame.K_9,
+                ):
+                    # Handle number input (0-9)
+                    digit = event.key - pygame.K_0
+                    new_input = self.max_score_input + str(digit)
+                    # Validate that the new input would be in range (1-50)
+                    try:
+                        test_value = int(new_input)
+                        if 1 <= test_value <= 50:
+                            self.max_score_input = new_input
+                    except ValueError:
+                        pass  # Ignore invalid input
+            else:
+                # Game controls
+                if event.key == pygame.K_ESCAPE:
+                    if self.game_over:
+                        # During game over, check for double-press to exit
+                        current_time = pygame.time.get_ticks()
+                        time_since_last_press = (
+                            current_time - self.last_esc_press_time
+                        )
+                        if (
+                            self.last_esc_press_time > 0
+                            and time_since_last_press
+                            < self.esc_double_press_threshold
+                        ):
+                            running = False
+                        else:
+                            # Single press just updates timer
+                            self.last_esc_press_time = current_time
+                    elif self.paused:
+                        # Check for double-press to exit
+                        current_time = pygame.time.get_ticks()
+                        time_since_last_press = (
+                            current_time - self.last_esc_press_time
+                        )
+                        if (
+                            self.last_esc_press_time > 0
+                            and time_since_last_press
+                            < self.esc_double_press_threshold
+                        ):
+                            running = False
+                        else:
+                            # Single press just updates timer, doesn't resume
+                            self.last_esc_press_time = current_time
+                    else:
+                        self.paused = True
+                        self.last_esc_press_time = 0  # Reset when pausing
+                        self.events.emit("pause")
+                elif (
+                    event.key == pygame.K_RETURN
+                    or event.key == pygame.K_KP_ENTER
+                ):
+                    if self.paused:
+                        self.paused = False
+                        self.events.emit("resume")
+                elif self.paused:
+                    # Speed adjustment controls when paused
+                    if event.key == pygame.K_UP:
+                        self.adjust_speed(0.1)
+                    elif event.key == pygame.K_DOWN:
+                        self.adjust_speed(-0.1)
+                    elif event.key == pygame.K_a:
+                        self.cycle_ai_difficulty()
+                    elif event.key == pygame.K_m:
+                        # Return to main menu
+                        self.reset_to_menu()
+        return running
 
     def run(self):
         """Main game loop"""
+        if self.gc_controller is not None:
+            self.gc_controller.start()
         running = True
         while running:
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if not self.handle_event(event):
                     running = False
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left mouse button
-                        if self.paused and self.menu_button_rect:
-                            if self.menu_button_rect.collidepoint(event.pos):
-                                self.reset_to_menu()
-                if event.type == pygame.KEYDOWN:
-                    if not self.game_started:
-                        # Start menu controls
-                        if (
-                            event.key == pygame.K_RETURN
-                            or event.key == pygame.K_KP_ENTER
-                        ):
-                            # Validate and set max_score before starting
-                            if self.max_score_input:
-                                try:
-                                    score = int(self.max_score_input)
-                                    if 1 <= score <= 50:
-                                        self.max_score = score
-                                    else:
-                                        # If invalid, use default
-                                        self.max_score = 10
-                                except ValueError:
-                                    self.max_score = 10
-                            else:
-                                # Default if no input
-                                self.max_score = 10
-                            self.game_started = True
-                        elif event.key == pygame.K_UP:
-                            self.adjust_speed(0.1)
-                        elif event.key == pygame.K_DOWN:
-                            self.adjust_speed(-0.1)
-                        elif event.key == pygame.K_a:
-                            self.cycle_ai_difficulty()
-                        elif event.key == pygame.K_BACKSPACE:
-                            # Handle backspace to delete last character
-                            if self.max_score_input:
-                                self.max_score_input = self.max_score_input[:-1]
-                        elif event.key in (
-                            pygame.K_0,
-                            pygame.K_1,
-                            pygame.K_2,
-                            pygame.K_3,
-                            pygame.K_4,
-                            pygame.K_5,
-                            pygame.K_6,
-                            pygame.K_7,
-                            pygame.K_8,
-                            pygame.K_9,
-                        ):
-                            # Handle number input (0-9)
-                            digit = event.key - pygame.K_0
-                            new_input = self.max_score_input + str(digit)
-                            # Validate that the new input would be in range (1-50)
-                            try:
-                                test_value = int(new_input)
-                                if 1 <= test_value <= 50:
-                                    self.max_score_input = new_input
-                            except ValueError:
-                                pass  # Ignore invalid input
-                    else:
-                        # Game controls
-                        if event.key == pygame.K_ESCAPE:
-                            if self.game_over:
-                                # During game over, check for double-press to exit
-                                current_time = pygame.time.get_ticks()
-                                time_since_last_press = (
-                                    current_time - self.last_esc_press_time
-                                )
-                                if (
-                                    self.last_esc_press_time > 0
-                                    and time_since_last_press
-                                    < self.esc_double_press_threshold
-                                ):
-                                    running = False
-                                else:
-                                    # Single press just updates timer
-                                    self.last_esc_press_time = current_time
-                            elif self.paused:
-                                # Check for double-press to exit
-                                current_time = pygame.time.get_ticks()
-                                time_since_last_press = (
-                                    current_time - self.last_esc_press_time
-                                )
-                                if (
-                                    self.last_esc_press_time > 0
-                                    and time_since_last_press
-                                    < self.esc_double_press_threshold
-                                ):
-                                    running = False
-                                else:
-                                    # Single press just updates timer, doesn't resume
-                                    self.last_esc_press_time = current_time
-                            else:
-                                self.paused = True
-                                self.last_esc_press_time = 0  # Reset when pausing
-                        elif (
-                            event.key == pygame.K_RETURN
-                            or event.key == pygame.K_KP_ENTER
-                        ):
-                            if self.paused:
-                                self.paused = False
-                        elif self.paused:
-                            # Speed adjustment controls when paused
-                            if event.key == pygame.K_UP:
-                                self.adjust_speed(0.1)
-                            elif event.key == pygame.K_DOWN:
-                                self.adjust_speed(-0.1)
-                            elif event.key == pygame.K_a:
-                                self.cycle_ai_difficulty()
-                            elif event.key == pygame.K_m:
-                                # Return to main menu
-                                self.reset_to_menu()
 
             if self.game_started:
                 self.handle_input()
@@ -539,6 +804,16 @@ class Game:
                 self.draw()
             else:
                 self.draw_start_menu()
+            if self.gc_controller is not None or self.diagnostics is not None:
+                state = self.frame_state()
+                if self.gc_controller is not None:
+                    self.gc_controller.frame(state == "playing")
+                if self.diagnostics is not None:
+                    self.diagnostics.end_frame(state)
             clock.tick(60)  # 60 FPS
 
+        if self.recorder is not None:
+            self.recorder.end_match(self)
+        if self.diagnostics is not None:
+            print(self.diagnostics.report())
         pygame.quit()
@@ -0,0 +1,181 @@
+import struct
+import time
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+
+DEFAULT_NAME = "pong_live_state"
+
+# Block layout (little-endian):
+#   0   magic, version
+#   16  sequence number; odd while the writer is updating the state
+#   24  state record (_STATE)
+LIVE_MAGIC = b"PONGLIVE"
+LIVE_VERSION = 2
+_HEADER = struct.Struct("<8sH")
+_SEQ = struct.Struct("<Q")
+_SEQ_OFFSET = 16
+_STATE = struct.Struct("<QiiddiiiiBBBI")
+_STATE_OFFSET = 24
+BLOCK_SIZE = _STATE_OFFSET + _STATE.size
+
+LiveState = namedtuple(
+    "LiveState",
+    (
+        "tick",
+        "ball_x",
+        "ball_y",
+        "ball_velocity_x",
+        "ball_velocity_y",
+        "player_y",
+        "ai_y",
+        "player_score",
+        "ai_score",
+        "paused",
+        "game_over",
+        "game_started",
+        "balls",
+    ),
+)
+
+# Blocks created by writers in this process (see LiveStateReader)
+_owned = set()
+
+
+class LiveStateWriter:
+    """Publishes live game state to a shared memory block for other processes
+
+    The state is written in place with a seqlock: the sequence number is odd
+    while a write is in progress, so readers can tell a torn read and retry
+    without ever blocking the game. ``subscribe`` publishes after every tick,
+    when a match starts, on pause, resume and game over and on the way back to
+    the menu. Positions are top-left corners of the ball and the paddles.
+    ``balls`` is the number of balls in play; in multi-ball mode (more than
+    one) the ball fields are zero and carry no meaning.
+    """
+
+    def __init__(self, name=DEFAULT_NAME):
+        try:
+            self.shm = shared_memory.SharedMemory(name, create=True, size=BLOCK_SIZE)
+        except FileExistsError:
+            # Left over from a run that did not shut down cleanly
+            self.shm = shared_memory.SharedMemory(name)
+            if self.shm.size < BLOCK_SIZE:
+                self.shm.close()
+                raise ValueError(f"Shared memory block {name} is too small")
+        self.name = name
+        _owned.add(self.shm._name)
+        self.tick = 0
+        self._buf = self.shm.buf
+        self._seq = 0
+        _SEQ.pack_into(self._buf, _SEQ_OFFSET, 0)
+        _HEADER.pack_into(self._buf, 0, LIVE_MAGIC, LIVE_VERSION)
+
+    def subscribe(self, events, game):
+        """Publish ``game`` after every tick and whenever the screen changes"""
+
+        def on_tick_end():
+            self.tick += 1
+            self.publish(game)
+
+        events.subscribe("tick_end", on_tick_end)
+        events.subscribe("start", lambda: self.publish(game))
+        events.subscribe("reset", lambda: self.publish(game))
+        events.subscribe("pause", lambda: self.publish(game))
+        events.subscribe("resume", lambda: self.publish(game))
+        events.subscribe(
+            "game_over", lambda winner, player_score, ai_score: self.publish(game)
+        )
+
+    def publish(self, game):
+        """Write the current state of ``game``"""
+        buf = self._buf
+        store = game.ball_store
+        if store is None:
+            ball = game.ball
+            ball_x, ball_y = ball.rect.x, ball.rect.y
+            velocity_x, velocity_y = ball.velocity_x, ball.velocity_y
+            balls = 1
+        else:
+            ball_x = ball_y = 0
+            velocity_x = velocity_y = 0.0
+            balls = store.count
+        seq = self._seq + 1
+        _SEQ.pack_into(buf, _SEQ_OFFSET, seq)
+        _STATE.pack_into(
+            buf,
+            _STATE_OFFSET,
+            self.tick,
+            ball_x,
+            ball_y,
+            velocity_x,
+            velocity_y,
+            game.player_paddle.rect.y,
+            game.ai_paddle.rect.y,
+            game.player_score,
+            game.ai_score,
+            game.paused,
+            game.game_over,
+            game.game_started,
+            balls,
+        )
+        self._seq = seq + 1
+        _SEQ.pack_into(buf, _SEQ_OFFSET, self._seq)
+
+    def close(self):
+        """Detach and remove the shared memory block"""
+        self._buf = None
+        self.shm.close()
+        self.shm.unlink()
+        _owned.discard(self.shm._name)
+
+
+class LiveStateReader:
+    """Reads the state a LiveStateWriter publishes, from any process"""
+
+    def __init__(self, name=DEFAULT_NAME):
+        # Attaching registers the block with this process's resource tracker,
+        # which would remove it when the reader exits; only the writer owns it
+        try:
+            self.shm = shared_memory.SharedMemory(name, track=False)
+        except TypeError:  # Python < 3.13
+            self.shm = shared_memory.SharedMemory(name)
+            # A writer in this process shares the registration and drops it
+            # itself on unlink; unregistering twice fails in the tracker
+            if self.shm._name not in _owned:
+                resource_tracker.unregister(self.shm._name, "shared_memory")
+        self._buf = self.shm.buf
+        magic, version = _HEADER.unpack_from(self._buf, 0)
+        if magic != LIVE_MAGIC or version != LIVE_VERSION:
+            self.close()
+            raise ValueError(f"Not a version {LIVE_VERSION} live state block: {name}")
+
+    def read(self, timeout=0.1):
+        """Return a consistent LiveState, or None if nothing was published yet
+
+        Raises TimeoutError if a write stays in progress for ``timeout``
+        seconds, which means the writer died in the middle of one.
+        """
+        buf = self._buf
+        deadline = None
+        while True:
+            before = _SEQ.unpack_from(buf, _SEQ_OFFSET)[0]
+            if before & 1:
+                # Write in progress; only look at the clock on this rare path
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + timeout
+                elif now > deadline:
+                    raise TimeoutError(
+                        "Live state writer stopped in the middle of a write"
+                    )
+                continue
+            if before == 0:
+                return None
+            state = _STATE.unpack_from(buf, _STATE_OFFSET)
+            if _SEQ.unpack_from(buf, _SEQ_OFFSET)[0] == before:
+                return LiveState._make(state)
+
+    def close(self):
+        """Detach from the shared memory block"""
+        self._buf = None
+        self.shm.close()
@@ -0,0 +1,232 @@
+import pygame
+import math
+import random
+from array import array
+from itertools import repeat
+from .constants import BALL_SIZE, MAX_PARTICLES, WINDOW_WIDTH, WHITE, GRAY
+
+# Particle kinds (index into the sprite table)
+SPARK = 0
+TRAIL = 1
+BURST = 2
+
+# Number of pre-rendered alpha steps per kind for fading out
+FADE_LEVELS = 4
+
+_KIND_STYLES = {
+    SPARK: (WHITE, 3),
+    TRAIL: (GRAY, BALL_SIZE // 3),
+    BURST: (WHITE, 5),
+}
+
+# Offset from a particle's center to its sprite's top-left corner
+_HALF_SIZES = [_KIND_STYLES[kind][1] // 2 for kind in sorted(_KIND_STYLES)]
+_MAX_SIZE = max(size for _, size in _KIND_STYLES.values())
+
+
+class ParticleSystem:
+    """Fixed-size particle pool for hit sparks, goal bursts and ball trails
+
+    Particles have no per-particle objects: their state lives in preallocated
+    parallel arrays and live particles are kept packed at the front, so update
+    and draw cost is bounded by the pool size. When the pool is saturated new
+    particles take over live slots in round-robin order instead of growing the
+    pool; removals reorder slots, so the particle replaced is not necessarily
+    the oldest.
+    """
+
+    __slots__ = (
+        "capacity",
+        "count",
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "life",
+        "max_life",
+        "kind",
+        "sprites",
+        "rng",
+        "_cursor",
+        "_blit_sequence",
+        "_blit",
+    )
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        self.x = array("d", bytes(8 * capacity))
+        self.y = array("d", bytes(8 * capacity))
+        self.vx = array("d", bytes(8 * capacity))
+        self.vy = array("d", bytes(8 * capacity))
+        self.life = array("H", bytes(2 * capacity))
+        self.max_life = array("H", bytes(2 * capacity))
+        self.kind = array("B", bytes(capacity))
+        self.sprites = self._build_sprites()
+        # Own generator so effects never disturb the gameplay random sequence
+        self.rng = random.Random()
+        self._cursor = 0
+        # Entries for the live particles; resized in place as count changes
+        self._blit_sequence = []
+        # pygame-ce's fblits skips building a result list; fall back to blits
+        self._blit = getattr(pygame.Surface, "fblits", None)
+
+    def _build_sprites(self):
+        """Pre-render one small surface per (kind, fade level)"""
+        sprites = []
+        for kind in sorted(_KIND_STYLES):
+            color, size = _KIND_STYLES[kind]
+            for level in range(FADE_LEVELS):
+                sprite = pygame.Surface((size, size))
+                sprite.fill(color)
+                sprite.set_alpha(255 * (level + 1) // FADE_LEVELS)
+                sprites.append(sprite)
+        return sprites
+
+    def clear(self):
+        """Remove all particles"""
+        self.count = 0
+
+    def emit(self, kind, x, y, vx, vy, life):
+        """Add one particle centered on (x, y)
+
+        When the pool is full the next slot in round-robin order is
+        overwritten instead, whichever live particle holds it.
+        """
+        if self.count < self.capacity:
+            i = self.count
+            self.count += 1
+        else:
+            i = self._cursor
+            self._cursor = (i + 1) % self.capacity
+        half = _HALF_SIZES[kind]
+        self.x[i] = x - half
+        self.y[i] = y - half
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.max_life[i] = life
+        self.kind[i] = kind
+
+    def _emit_spread(self, kind, x, y, count, speed, angle, spread, life):
+        """Emit ``count`` particles in a cone around ``angle`` (radians)"""
+        rng = self.rng
+        for _ in range(count):
+            a = angle + rng.uniform(-spread, spread)
+            s = speed * rng.uniform(0.4, 1.0)
+            self.emit(
+                kind, x, y, s * math.cos(a), s * math.sin(a), life + rng.randint(0, 8)
+            )
+
+    def spawn_paddle_hit(self, x, y, direction):
+        """Sparks flying off a paddle; ``direction`` is the ball's new x direction"""
+        angle = 0.0 if direction > 0 else math.pi
+        self._emit_spread(SPARK, x, y, 12, 4.0, angle, 0.9, 14)
+
+    def spawn_wall_hit(self, x, y):
+        """Sparks flying off the top or bottom wall"""
+        angle = math.pi / 2 if y < BALL_SIZE else -math.pi / 2
+        self._emit_spread(SPARK, x, y, 6, 3.0, angle, 1.0, 10)
+
+    def spawn_goal(self, x, y):
+        """A burst in every direction where the ball left the field"""
+        self._emit_spread(BURST, x, y, 40, 6.0, 0.0, math.pi, 30)
+
+    def subscribe(self, events):
+        """Spawn hit sparks and goal bursts from a game's event hooks"""
+        events.subscribe("wall_hit", self.spawn_wall_hit)
+        events.subscribe(
+            "paddle_hit",
+            lambda side, x, y, offset: self.spawn_paddle_hit(
+                x, y, 1 if side == "player" else -1
+            ),
+        )
+        events.subscribe(
+            "goal",
+            lambda scorer, y: self.spawn_goal(
+                0 if scorer == "ai" else WINDOW_WIDTH, y
+            ),
+        )
+
+    def spawn_trail(self, x, y):
+        """A short-lived, motionless mark behind the ball"""
+        self.emit(TRAIL, x, y, 0.0, 0.0, 8)
+
+    def update(self):
+        """Move particles and drop the ones that burned out"""
+        xs, ys, vx, vy = self.x, self.y, self.vx, self.vy
+        life, max_life, kind = self.life, self.max_life, self.kind
+        i = 0
+        count = self.count
+        while i < count:
+            remaining = life[i] - 1
+            if remaining <= 0:
+                # Swap the last live particle into this slot to stay packed
+                count -= 1
+                xs[i], ys[i], vx[i], vy[i] = xs[count], ys[count], vx[count], vy[count]
+                life[i], max_life[i], kind[i] = life[count], max_life[count], kind[count]
+                continue
+            life[i] = remaining
+            xs[i] += vx[i]
+            ys[i] += vy[i]
+            i += 1
+        self.count = count
+        if self._cursor >= count:
+            self._cursor = 0
+
+    def bounds(self, rect):
+        """Set ``rect`` to cover every live particle and return it
+
+        Returns None, leaving ``rect`` untouched, if there are none.
+        """
+        count = self.count
+        if not count:
+            return None
+        xs, ys = self.x, self.y
+        left = right = xs[0]
+        top = bottom = ys[0]
+        # Plain loop: slicing the arrays for min/max would copy them per frame
+        i = 1
+        while i < count:
+            x = xs[i]
+            if x < left:
+                left = x
+            elif x > right:
+                right = x
+            y = ys[i]
+            if y < top:
+                top = y
+            elif y > bottom:
+                bottom = y
+            i += 1
+        left = int(left)
+        top = int(top)
+        rect.update(
+            left,
+            top,
+            int(right) - left + _MAX_SIZE + 1,
+            int(bottom) - top + _MAX_SIZE + 1,
+        )
+        return rect
+
+    def draw(self, surface):
+        """Draw all live particles with a single batched blit"""
+        count = self.count
+        if not count:
+            return
+        sprites = self.sprites
+        xs, ys = self.x, self.y
+        life, max_life, kind = self.life, self.max_life, self.kind
+        sequence = self._blit_sequence
+        # Resize in place rather than slicing a fresh list every frame
+        if len(sequence) > count:
+            del sequence[count:]
+        elif len(sequence) < count:
+            sequence.extend(repeat(None, count - len(sequence)))
+        for i in range(count):
+            level = life[i] * FADE_LEVELS // (max_life[i] + 1)
+            sequence[i] = (sprites[kind[i] * FADE_LEVELS + level], (xs[i], ys[i]))
+        if self._blit is not None:
+            self._blit(surface, sequence)
+        else:
+            surface.blits(sequence, doreturn=False)
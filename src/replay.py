@@ -0,0 +1,140 @@
+import json
+import os
+import random
+import time
+from array import array
+from .bots import BotPaddle
+
+REPLAY_VERSION = 1
+
+
+class MatchRecorder:
+    """Records matches so they can be re-simulated tick for tick
+
+    The global random generator (used by Ball and AIPaddle) and the particle
+    generator are seeded at match start and the starting state is saved, so
+    the only input that has to be stored per tick is the player paddle's
+    position. Speed and difficulty changes (made while paused) are stored with
+    the ball velocity and AI speed they left behind. Each match is written to
+    ``directory`` as JSON when it ends.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.replay = None
+        self._paddle_y = None
+
+    def start_match(self, game):
+        """Seed the game's random generators and capture its starting state"""
+        if game.ball_store is not None:
+            print("Warning: Multi-ball matches are not recorded")
+            return
+        if game.ai_vs_ai:
+            print("Warning: AI-vs-AI matches are not recorded")
+            return
+        if isinstance(game.ai_paddle, BotPaddle):
+            # Replays re-simulate the right paddle with the built-in AI
+            print("Warning: Bot-driven matches are not recorded")
+            return
+        seed = random.randrange(2**32)
+        random.seed(seed)
+        game.particles.rng.seed(seed)
+        ball = game.ball
+        self._paddle_y = array("h")
+        self.replay = {
+            "version": REPLAY_VERSION,
+            "recorded_at": time.time(),
+            "seed": seed,
+            "speed_multiplier": game.speed_multiplier,
+            "ai_difficulty": game.ai_difficulty,
+            "max_score": game.max_score,
+            "ball": [ball.rect.x, ball.rect.y, ball.velocity_x, ball.velocity_y],
+            "player_y": game.player_paddle.rect.y,
+            "ai_y": game.ai_paddle.rect.y,
+            "ai_speed": game.ai_paddle.speed,
+            "changes": [],
+        }
+
+    def tick(self, game):
+        """Record the input for one Game.update tick"""
+        if self.replay is not None:
+            self._paddle_y.append(game.player_paddle.rect.y)
+
+    def settings_changed(self, game):
+        """Record a speed or difficulty change before the next tick"""
+        if self.replay is None:
+            return
+        self.replay["changes"].append(
+            [
+                len(self._paddle_y),
+                game.speed_multiplier,
+                game.ai_difficulty,
+                game.ball.velocity_x,
+                game.ball.velocity_y,
+                game.ai_paddle.speed,
+            ]
+        )
+
+    def end_match(self, game):
+        """Write the finished (or abandoned) match; returns its path"""
+        if self.replay is None:
+            return None
+        replay = self.replay
+        self.replay = None
+        replay["paddle_y"] = self._paddle_y.tolist()
+        replay["winner"] = game.game_winner
+        replay["final_score"] = [game.player_score, game.ai_score]
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(replay["recorded_at"]))
+        path = os.path.join(self.directory, f"match-{stamp}-{replay['seed']:08x}.json")
+        with open(path, "w") as replay_file:
+            json.dump(replay, replay_file)
+        return path
+
+
+def load_replay(path):
+    """Read a replay written by MatchRecorder"""
+    with open(path) as replay_file:
+        replay = json.load(replay_file)
+    if replay.get("version") != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version in {path}")
+    return replay
+
+
+def replay_ticks(game, replay):
+    """Restore a replay's starting state into ``game`` and re-simulate it
+
+    Yields after every Game.update, with ``game`` holding that tick's state.
+    """
+    game.set_speed(replay["speed_multiplier"])
+    game.set_ai_difficulty(replay["ai_difficulty"])
+    game.max_score = replay["max_score"]
+    game.player_score = 0
+    game.ai_score = 0
+    game.game_over = False
+    game.game_winner = None
+    game.game_started = True
+    game.particles.clear()
+    ball = game.ball
+    ball.rect.x, ball.rect.y, ball.velocity_x, ball.velocity_y = replay["ball"]
+    game.player_paddle.rect.y = replay["player_y"]
+    game.ai_paddle.rect.y = replay["ai_y"]
+    game.ai_paddle.speed = replay["ai_speed"]
+    random.seed(replay["seed"])
+    game.particles.rng.seed(replay["seed"])
+
+    changes = replay["changes"]
+    next_change = 0
+    for tick, paddle_y in enumerate(replay["paddle_y"]):
+        while next_change < len(changes) and changes[next_change][0] == tick:
+            _, speed, difficulty, velocity_x, velocity_y, ai_speed = changes[
+                next_change
+            ]
+            game.set_speed(speed)
+            game.set_ai_difficulty(difficulty)
+            ball.velocity_x, ball.velocity_y = velocity_x, velocity_y
+            game.ai_paddle.speed = ai_speed
+            next_change += 1
+        game.player_paddle.rect.y = paddle_y
+        game.update()
+        yield tick
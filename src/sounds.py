@@ -1,20 +1,90 @@
 import pygame
+import math
 import os
-import sys
+from array import array
+from .assets import AssetBundle, BundleError, BUNDLE_NAME, assets_dir
+from .constants import MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER
+
+SOUND_NAMES = ("wall_hit", "paddle_hit", "goal_scored")
+
+# Stereo panning: every sound is pre-rendered at PAN_STEPS positions from
+# left to right; PAN_SPREAD < 1 keeps the far channel audible at the edges
+PAN_STEPS = 9
+PAN_SPREAD = 0.75
+
+
+def pan_gains(step):
+    """Return the (left, right) gains of pan position ``step``
+
+    Equal-power panning, scaled so that the center keeps full volume on both
+    channels like the unpanned sound.
+    """
+    pan = (step / (PAN_STEPS - 1) * 2 - 1) * PAN_SPREAD
+    angle = (pan + 1) * math.pi / 4
+    return (
+        min(1.0, math.cos(angle) * math.sqrt(2)),
+        min(1.0, math.sin(angle) * math.sqrt(2)),
+    )
+
+
+PAN_GAINS = tuple(pan_gains(step) for step in range(PAN_STEPS))
+
+
+def pan_asset_name(name, step):
+    """Name of a sound's panned copy in the asset bundle"""
+    return f"{name}.pan{step}"
+
+
+def pan_variants(raw):
+    """Pan signed 16-bit stereo audio (native byte order) to every pan step
+
+    Returns one sample array per step, or None for steps that leave both
+    channels at full volume and so would just copy ``raw``.
+    """
+    samples = array("h", raw)
+    channel_samples = (samples[0::2], samples[1::2])
+    scaled = {}  # (channel, gain) -> samples; mirrored steps share gains
+    variants = []
+    for step_gains in PAN_GAINS:
+        if step_gains == (1.0, 1.0):
+            variants.append(None)
+            continue
+        panned = array("h", samples)
+        for channel, gain in enumerate(step_gains):
+            key = (channel, gain)
+            if key not in scaled:
+                scaled[key] = array(
+                    "h", [int(v * gain) for v in channel_samples[channel]]
+                )
+            panned[channel::2] = scaled[key]
+        variants.append(panned)
+    return variants
 
 
 class SoundManager:
-    """Manages sound effects for the game"""
+    """Manages sound effects for the game
+
+    Effects are panned by where they happen. Panned copies of every sound are
+    loaded from the asset bundle (or rendered once at load time without it)
+    into ``variants`` (name -> one Sound per pan step), so playing one is a
+    table lookup and never converts audio.
+    """
 
-    def __init__(self):
+    def __init__(self, use_bundle=True):
         """Initialize sound manager and load sound files"""
         self.sounds = {}
+        self.variants = {}
         self.enabled = True
 
         # Initialize pygame mixer (if not already initialized)
         try:
             if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+                pygame.mixer.init(
+                    frequency=MIXER_FREQUENCY,
+                    size=MIXER_SIZE,
+                    channels=MIXER_CHANNELS,
+                    buffer=MIXER_BUFFER,
+                )
         except pygame.error:
             print("Warning: Could not initialize sound system. Sound effects disabled.")
             self.enabled = False
@@ -22,19 +92,60 @@ class SoundManager:
 
         # Get the assets directory path
         # This works whether running from project root or from pooooooong directory
-        if getattr(sys, "frozen", False):
-            # If running as a compiled executable
-            base_path = sys._MEIPASS
-        else:
-            # If running as a script
-            base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        directory = assets_dir()
 
-        assets_dir = os.path.join(base_path, "assets")
+        # Prefer the pre-decoded bundle (scripts/build_asset_bundle.py) and
+        # fall back to decoding the loose WAV files
+        bundle_path = os.path.join(directory, BUNDLE_NAME)
+        if not (
+            use_bundle
+            and os.path.exists(bundle_path)
+            and self._load_bundle(bundle_path)
+        ):
+            for name in SOUND_NAMES:
+                self._load_sound(name, os.path.join(directory, f"{name}.wav"))
+        self._build_variants()
+        # Dedicated channel for the goal sound to ensure it plays
+        self.goal_channel = pygame.mixer.Channel(0)
 
-        # Load sound files
-        self._load_sound("wall_hit", os.path.join(assets_dir, "wall_hit.wav"))
-        self._load_sound("paddle_hit", os.path.join(assets_dir, "paddle_hit.wav"))
-        self._load_sound("goal_scored", os.path.join(assets_dir, "goal_scored.wav"))
+    def _load_bundle(self, path):
+        """Load every sound from an asset bundle; returns True on success"""
+        try:
+            bundle = AssetBundle(path)
+        except BundleError as e:
+            print(f"Warning: Could not load asset bundle: {e}")
+            return False
+        try:
+            if bundle.mixer_format != pygame.mixer.get_init():
+                print(
+                    f"Warning: Asset bundle built for mixer format "
+                    f"{bundle.mixer_format}, mixer is {pygame.mixer.get_init()}"
+                )
+                return False
+            corrupt = bundle.verify()
+            if corrupt:
+                print(f"Warning: Corrupt assets in bundle: {', '.join(corrupt)}")
+                return False
+            sounds = {
+                name: pygame.mixer.Sound(buffer=bundle.get(name))
+                for name in SOUND_NAMES
+            }
+            # Bundles built before panning lack the panned copies; those
+            # are rendered by _build_variants instead
+            variants = {}
+            for name, sound in sounds.items():
+                try:
+                    variants[name] = self._bundle_variants(bundle, name, sound)
+                except KeyError:
+                    pass
+        except (KeyError, pygame.error) as e:
+            print(f"Warning: Could not load sound from asset bundle: {e}")
+            return False
+        finally:
+            bundle.close()
+        self.sounds.update(sounds)
+        self.variants.update(variants)
+        return True
 
     def _load_sound(self, name, filepath):
         """Load a sound file"""
@@ -48,33 +159,104 @@ class SoundManager:
             print(f"Warning: Could not load sound {filepath}: {e}")
             self.sounds[name] = None
 
-    def play_wall_hit(self):
-        """Play sound when ball hits a wall"""
-        if self.enabled and self.sounds.get("wall_hit"):
+    def _bundle_variants(self, bundle, name, sound):
+        """Load a sound's panned copies from a bundle"""
+        # Views into the bundle are released on return so it can be closed
+        buffers = [
+            None if gains == (1.0, 1.0) else bundle.get(pan_asset_name(name, step))
+            for step, gains in enumerate(PAN_GAINS)
+        ]
+        return self._make_variants(sound, buffers)
+
+    def _make_variants(self, sound, buffers):
+        """Return one Sound per pan step; None buffers reuse ``sound``"""
+        return tuple(
+            sound if buffer is None else pygame.mixer.Sound(buffer=buffer)
+            for buffer in buffers
+        )
+
+    def _build_variants(self):
+        """Render panned copies of loaded sounds the bundle did not provide"""
+        frequency, size, channels = pygame.mixer.get_init()
+        for name, sound in self.sounds.items():
+            if sound is None or name in self.variants:
+                continue
+            if size != -16 or channels != 2:
+                # Panning needs signed 16-bit stereo; play the sound as is
+                self.variants[name] = (sound,) * PAN_STEPS
+            else:
+                buffers = pan_variants(sound.get_raw())
+                self.variants[name] = self._make_variants(sound, buffers)
+
+    def _variant(self, name, pan):
+        """Return the pre-rendered Sound closest to ``pan``, or None"""
+        variants = self.variants.get(name)
+        if not variants:
+            return None
+        step = int((pan + 1) * (PAN_STEPS - 1) / 2 + 0.5)
+        return variants[0 if step < 0 else min(step, PAN_STEPS - 1)]
+
+    def subscribe(self, events, width):
+        """Play sound effects from a game's event hooks
+
+        Sounds are panned by the x position of the event on a field ``width``
+        pixels wide.
+        """
+        events.subscribe("wall_hit", lambda x, y: self.play_wall_hit(x * 2 / width - 1))
+        events.subscribe(
+            "paddle_hit",
+            lambda side, x, y, offset: self.play_paddle_hit(x * 2 / width - 1),
+        )
+        # The ball leaves on the left edge when the AI scores
+        events.subscribe(
+            "goal",
+            lambda scorer, y: self.play_goal_scored(-1.0 if scorer == "ai" else 1.0),
+        )
+
+    def play_wall_hit(self, pan=0.0):
+        """Play sound when ball hits a wall; ``pan`` is -1 (left) to 1 (right)"""
+        sound = self._variant("wall_hit", pan)
+        if self.enabled and sound:
             try:
-                self.sounds["wall_hit"].play()
+                sound.play()
             except pygame.error:
                 pass  # Silently fail if sound can't play
 
-    def play_paddle_hit(self):
-        """Play sound when ball hits a paddle"""
-        if self.enabled and self.sounds.get("paddle_hit"):
+    def play_paddle_hit(self, pan=0.0):
+        """Play sound when ball hits a paddle; ``pan`` is -1 (left) to 1 (right)"""
+        sound = self._variant("paddle_hit", pan)
+        if self.enabled and sound:
             try:
-                self.sounds["paddle_hit"].play()
+                sound.play()
             except pygame.error:
                 pass  # Silently fail if sound can't play
 
-    def play_goal_scored(self):
-        """Play sound when a goal is scored"""
+    def play_goal_scored(self, pan=0.0):
+        """Play sound when a goal is scored; ``pan`` is -1 (left) to 1 (right)"""
         if not self.enabled:
             return
-        sound = self.sounds.get("goal_scored")
+        sound = self._variant("goal_scored", pan)
         if sound:
             try:
-                # Use a dedicated channel for goal sound to ensure it plays
-                channel = pygame.mixer.Channel(0)
-                channel.play(sound)
+                self.goal_channel.play(sound)
             except pygame.error as e:
                 print(f"Warning: Could not play goal scored sound: {e}")
         else:
             print("Warning: Goal scored sound not loaded")
+
+
+# SoundManager shared by every Game in this process (see shared_sound_manager)
+_shared = None
+
+
+def shared_sound_manager():
+    """Return this process's SoundManager, loading the sounds on first use
+
+    Every Game plays through the same manager, so the panned copies are
+    loaded or rendered once per process rather than once per Game, and no
+    Sound is ever freed while a channel may still be playing it.
+    """
+    global _shared
+    if _shared is None:
+        _shared = SoundManager()
+    return _shared
@@ -0,0 +1,322 @@
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    match_id TEXT PRIMARY KEY,
+    started_at REAL,
+    speed_multiplier REAL,
+    ai_difficulty TEXT,
+    max_score INTEGER,
+    ended_at REAL,
+    winner TEXT,
+    player_score INTEGER,
+    ai_score INTEGER
+);
+CREATE TABLE IF NOT EXISTS rallies (
+    match_id TEXT,
+    rally INTEGER,
+    hits INTEGER,
+    ticks INTEGER,
+    scorer TEXT,
+    speed_multiplier REAL,
+    ai_difficulty TEXT
+);
+CREATE TABLE IF NOT EXISTS hits (
+    match_id TEXT,
+    rally INTEGER,
+    side TEXT,
+    hit_offset REAL,
+    ball_speed REAL,
+    speed_multiplier REAL,
+    ai_difficulty TEXT
+);
+"""
+
+# Event tags; each queued event is a plain tuple starting with one of these
+MATCH_START = 0
+MATCH_END = 1
+RALLY = 2
+HIT = 3
+
+
+class TelemetryWriter:
+    """Persists telemetry events to SQLite from a background thread
+
+    ``record`` only appends a tuple to a deque (atomic under the GIL), so the
+    frame loop never waits on a lock or on disk. The writer thread wakes every
+    ``flush_interval`` seconds and writes everything queued in one transaction.
+    The queue holds at most ``max_queued`` events; when the writer falls that
+    far behind, the oldest events are dropped and counted in ``dropped``. A
+    batch that fails to write is dropped too, and if the database cannot be
+    opened at all recording stops.
+    """
+
+    def __init__(self, path, flush_interval=0.5, max_queued=100000):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.queue = deque(maxlen=max_queued)
+        self.enabled = True
+        self.written = 0
+        # Lost events, counted apart by the thread that loses them (queue
+        # overflow in record, failed writes in the writer) so the two never
+        # race on one counter
+        self._overflowed = 0
+        self._unwritten = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def dropped(self):
+        """Number of events that were not recorded"""
+        return self._overflowed + self._unwritten
+
+    def record(self, event):
+        """Queue an event tuple for writing (never blocks)"""
+        if not self.enabled:
+            return
+        queue = self.queue
+        if len(queue) == queue.maxlen:
+            self._overflowed += 1
+        queue.append(event)
+
+    def close(self):
+        """Flush remaining events and stop the writer thread"""
+        self._stop.set()
+        self._thread.join()
+        if self.dropped:
+            print(f"Warning: {self.dropped} telemetry events were not recorded")
+
+    def _run(self):
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            print(f"Warning: Telemetry disabled, could not open {self.path}: {e}")
+            self.enabled = False
+            self._unwritten += len(self.queue)
+            self.queue.clear()
+            return
+        try:
+            while not self._stop.wait(self.flush_interval):
+                self._drain(connection)
+            self._drain(connection)
+        finally:
+            connection.close()
+
+    def _drain(self, connection):
+        """Write every queued event in a single transaction"""
+        queue = self.queue
+        batch = []
+        while queue:
+            batch.append(queue.popleft())
+        if not batch:
+            return
+        try:
+            self._write_batch(connection, batch)
+        except Exception as e:
+            # Keep the thread alive; the next batch may well succeed
+            print(f"Warning: Could not write {len(batch)} telemetry events: {e}")
+            self._unwritten += len(batch)
+        else:
+            self.written += len(batch)
+
+    def _write_batch(self, connection, batch):
+        starts, ends, rallies, hits = [], [], [], []
+        for event in batch:
+            tag = event[0]
+            if tag == HIT:
+                hits.append(event[1:])
+            elif tag == RALLY:
+                rallies.append(event[1:])
+            elif tag == MATCH_START:
+                starts.append(event[1:])
+            elif tag == MATCH_END:
+                ends.append(event[1:])
+        with connection:
+            connection.executemany(
+                "INSERT INTO matches (match_id, started_at, speed_multiplier,"
+                " ai_difficulty, max_score) VALUES (?, ?, ?, ?, ?)",
+                starts,
+            )
+            connection.executemany(
+                "INSERT INTO rallies VALUES (?, ?, ?, ?, ?, ?, ?)", rallies
+            )
+            connection.executemany(
+                "INSERT INTO hits VALUES (?, ?, ?, ?, ?, ?, ?)", hits
+            )
+            connection.executemany(
+                "UPDATE matches SET ended_at = ?, winner = ?, player_score = ?,"
+                " ai_score = ? WHERE match_id = ?",
+                ends,
+            )
+
+
+class MatchTelemetry:
+    """Tracks match and rally state in Game and feeds a TelemetryWriter"""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.match_id = None
+        self.rally = 0
+        self.rally_hits = 0
+        self.rally_ticks = 0
+
+    def subscribe(self, events, game):
+        """Record ticks, paddle hits, goals and match ends of ``game``"""
+        events.subscribe("game_over", self.end_match)
+        events.subscribe("tick_start", self.tick)
+        if game.ball_store is not None:
+            # Multi-ball games report one hit and goal per tick; the store
+            # keeps them all. A rally there is the play between two goals.
+            events.subscribe(
+                "tick_end",
+                lambda: self.ball_store_tick(
+                    game.ball_store, game.speed_multiplier, game.ai_difficulty
+                ),
+            )
+            return
+        events.subscribe(
+            "paddle_hit",
+            lambda side, x, y, offset: self.paddle_hit(
+                side,
+                offset,
+                (game.ball.velocity_x**2 + game.ball.velocity_y**2) ** 0.5,
+                game.speed_multiplier,
+                game.ai_difficulty,
+            ),
+        )
+        events.subscribe(
+            "goal",
+            lambda scorer, y: self.goal(
+                scorer, game.speed_multiplier, game.ai_difficulty
+            ),
+        )
+
+    def start_match(self, speed_multiplier, ai_difficulty, max_score):
+        """Begin a new match"""
+        self.match_id = uuid.uuid4().hex
+        self.rally = 0
+        self.rally_hits = 0
+        self.rally_ticks = 0
+        self.writer.record(
+            (
+                MATCH_START,
+                self.match_id,
+                time.time(),
+                speed_multiplier,
+                ai_difficulty,
+                max_score,
+            )
+        )
+
+    def tick(self):
+        """Count one simulation tick of the current rally"""
+        self.rally_ticks += 1
+
+    def paddle_hit(self, side, offset, ball_speed, speed_multiplier, ai_difficulty):
+        """Record a paddle hit; ``offset`` is -1 (top edge) to 1 (bottom edge)"""
+        self.rally_hits += 1
+        self.writer.record(
+            (
+                HIT,
+                self.match_id,
+                self.rally,
+                side,
+                offset,
+                ball_speed,
+                speed_multiplier,
+                ai_difficulty,
+            )
+        )
+
+    def ball_store_tick(self, store, speed_multiplier, ai_difficulty):
+        """Record every paddle hit and goal of a multi-ball tick"""
+        paddles, offsets, speeds = (
+            store.hit_paddles,
+            store.hit_offsets,
+            store.hit_speeds,
+        )
+        for i in range(store.hit_count):
+            # Game passes the paddles to check_collisions player first
+            self.paddle_hit(
+                "ai" if paddles[i] else "player",
+                offsets[i],
+                speeds[i],
+                speed_multiplier,
+                ai_difficulty,
+            )
+        for _ in range(store.left_goals):
+            self.goal("ai", speed_multiplier, ai_difficulty)
+        for _ in range(store.right_goals):
+            self.goal("player", speed_multiplier, ai_difficulty)
+
+    def goal(self, scorer, speed_multiplier, ai_difficulty):
+        """Close the current rally, won by ``scorer`` ("player" or "ai")"""
+        self.writer.record(
+            (
+                RALLY,
+                self.match_id,
+                self.rally,
+                self.rally_hits,
+                self.rally_ticks,
+                scorer,
+                speed_multiplier,
+                ai_difficulty,
+            )
+        )
+        self.rally += 1
+        self.rally_hits = 0
+        self.rally_ticks = 0
+
+    def end_match(self, winner, player_score, ai_score):
+        """Finish the current match; ``winner`` is None if it was abandoned"""
+        if self.match_id is None:
+            return
+        self.writer.record(
+            (MATCH_END, time.time(), winner, player_score, ai_score, self.match_id)
+        )
+        self.match_id = None
+
+
+def summarize(path):
+    """Return aggregate statistics from a telemetry database"""
+    connection = sqlite3.connect(path)
+    try:
+        stats = {}
+        stats["matches"], stats["finished_matches"] = connection.execute(
+            "SELECT COUNT(*), COUNT(winner) FROM matches"
+        ).fetchone()
+        stats["rallies"], stats["mean_rally_hits"], stats["mean_rally_ticks"] = (
+            connection.execute(
+                "SELECT COUNT(*), AVG(hits), AVG(ticks) FROM rallies"
+            ).fetchone()
+        )
+        stats["hits"], stats["mean_abs_hit_offset"], stats["mean_ball_speed"] = (
+            connection.execute(
+                "SELECT COUNT(*), AVG(ABS(hit_offset)), AVG(ball_speed) FROM hits"
+            ).fetchone()
+        )
+        stats["player_goal_share_by_difficulty"] = dict(
+            connection.execute(
+                "SELECT ai_difficulty, AVG(scorer = 'player') FROM rallies"
+                " GROUP BY ai_difficulty"
+            ).fetchall()
+        )
+        stats["mean_rally_hits_by_speed"] = dict(
+            connection.execute(
+                "SELECT ROUND(speed_multiplier, 1), AVG(hits) FROM rallies"
+                " GROUP BY ROUND(speed_multiplier, 1)"
+            ).fetchall()
+        )
+        return stats
+    finally:
+        connection.close()
@@ -0,0 +1,248 @@
+import queue
+import threading
+import time
+from array import array
+import pygame
+from .constants import clock, SIMULATION_RATE
+from .export import capture_state, apply_state
+from .game import Game
+
+# Events the render thread forwards to the simulation thread
+FORWARDED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEMOTION,
+)
+
+# A simulation that falls this far behind drops the missed ticks instead of
+# running them back to back
+MAX_LAG = 0.25
+
+
+def capture_snapshot(game):
+    """Return a snapshot of everything the render thread draws
+
+    Snapshots only hold fresh copies and are never modified once published.
+    """
+    store = game.ball_store
+    return (
+        capture_state(game),
+        game.game_started,
+        game.paused,
+        game.speed_multiplier,
+        game.ai_difficulty,
+        game.max_score_input,
+        None if store is None else (store.x[: store.count], store.y[: store.count]),
+    )
+
+
+def apply_snapshot(game, snapshot):
+    """Load a snapshot from capture_snapshot into ``game`` for rendering"""
+    (
+        state,
+        game.game_started,
+        game.paused,
+        game.speed_multiplier,
+        game.ai_difficulty,
+        game.max_score_input,
+        balls,
+    ) = snapshot
+    apply_state(game, state)
+    if balls is not None:
+        xs, ys = balls
+        store = game.ball_store
+        store.x[: len(xs)] = xs
+        store.y[: len(ys)] = ys
+
+
+class TripleBuffer:
+    """Hands the newest snapshot from one writer thread to one reader thread
+
+    The writer fills its back slot and swaps it with the middle slot; the
+    reader swaps the middle slot into its front slot only if something newer
+    was published. The lock is held for the swap alone, so neither thread
+    ever waits for the other to finish a tick or a frame.
+    """
+
+    def __init__(self, initial):
+        self.slots = [initial, initial, initial]
+        self._back = 0
+        self._middle = 1
+        self._front = 2
+        self._fresh = False
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot):
+        """Make ``snapshot`` the newest one (writer thread)"""
+        self.slots[self._back] = snapshot
+        with self._lock:
+            self._back, self._middle = self._middle, self._back
+            self._fresh = True
+
+    def latest(self):
+        """Return the newest published snapshot (reader thread)"""
+        with self._lock:
+            if self._fresh:
+                self._front, self._middle = self._middle, self._front
+                self._fresh = False
+        return self.slots[self._front]
+
+
+class JitterStats:
+    """Interval statistics for a loop that should run every ``period`` seconds
+
+    Mean, mean jitter and maximum cover every interval; percentiles cover
+    the last ``window`` intervals, kept in a fixed-size ring buffer so a long
+    session does not grow memory.
+    """
+
+    def __init__(self, name, period, window=36000):
+        self.name = name
+        self.period = period
+        self.intervals = array("d", bytes(8 * window))
+        self.count = 0
+        self._total = 0.0
+        self._jitter = 0.0
+        self._max = 0.0
+        self._last = None
+
+    def mark(self):
+        """Call once per iteration of the loop"""
+        now = time.perf_counter()
+        if self._last is not None:
+            interval = now - self._last
+            intervals = self.intervals
+            intervals[self.count % len(intervals)] = interval
+            self.count += 1
+            self._total += interval
+            self._jitter += abs(interval - self.period)
+            if interval > self._max:
+                self._max = interval
+        self._last = now
+
+    def report(self):
+        """Return a one-line summary"""
+        count = self.count
+        if not count:
+            return f"  {self.name}: no intervals"
+        recent = sorted(self.intervals[: min(count, len(self.intervals))])
+        p99 = recent[min(len(recent) - 1, int(len(recent) * 0.99))]
+        return (
+            f"  {self.name}: {count} intervals, target {self.period * 1000:.3f} ms, "
+            f"mean {self._total / count * 1000:.3f} ms, "
+            f"mean jitter {self._jitter / count * 1000:.3f} ms, "
+            f"p99 {p99 * 1000:.3f} ms, max {self._max * 1000:.3f} ms"
+        )
+
+
+class ThreadedRunner:
+    """Runs a Game's simulation on a worker thread, apart from rendering
+
+    The simulation thread owns ``game``: it handles input forwarded over a
+    queue, ticks at a fixed ``rate`` and publishes a snapshot after every
+    tick through a TripleBuffer. The main thread (which has to own the window
+    and the event queue) forwards input, draws the newest snapshot into a
+    separate view Game and flips the display, so a slow frame never delays
+    physics and a slow tick never delays a frame.
+    """
+
+    def __init__(self, game, rate=SIMULATION_RATE):
+        self.game = game
+        self.period = 1 / rate
+        store = game.ball_store
+        self.view = Game(
+            multiball=store.count if store is not None else 0, display=game.display
+        )
+        self.inputs = queue.SimpleQueue()
+        self.buffer = TripleBuffer(capture_snapshot(game))
+        self.running = True
+        self.simulation_jitter = JitterStats("simulation", self.period)
+        self.render_jitter = JitterStats("render", 1 / 60)
+        self._mouse_y = None
+        self._thread = threading.Thread(
+            target=self._simulate, name="simulation", daemon=True
+        )
+
+    def _handle_inputs(self):
+        game = self.game
+        inputs = self.inputs
+        while not inputs.empty():
+            event = inputs.get()
+            if event.type == pygame.MOUSEMOTION:
+                self._mouse_y = game.to_logical(event.pos)[1]
+            elif not game.handle_event(event):
+                self.running = False
+
+    def _simulate(self):
+        """Simulation thread: fixed-rate ticks mirroring Game.run"""
+        game = self.game
+        period = self.period
+        next_tick = time.perf_counter()
+        try:
+            while self.running:
+                self._handle_inputs()
+                if game.game_started:
+                    if (
+                        not game.paused
+                        and not game.ai_vs_ai
+                        and self._mouse_y is not None
+                    ):
+                        game.player_paddle.set_position(self._mouse_y)
+                    if not game.paused and not game.game_over:
+                        game.update()
+                self.buffer.publish(capture_snapshot(game))
+                self.simulation_jitter.mark()
+                next_tick += period
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                elif delay < -MAX_LAG:
+                    next_tick = time.perf_counter()
+        finally:
+            self.running = False
+
+    def run(self):
+        """Main game loop; renders on the calling thread"""
+        game = self.game
+        view = self.view
+        if game.gc_controller is not None:
+            game.gc_controller.start()
+        self._thread.start()
+        while self.running:
+            for event in pygame.event.get():
+                if view.display is not None:
+                    view.display.handle_event(event)
+                if event.type in FORWARDED_EVENTS:
+                    self.inputs.put(event)
+            apply_snapshot(view, self.buffer.latest())
+            if view.game_started:
+                view.draw()
+            else:
+                view.draw_start_menu()
+            if game.gc_controller is not None or game.diagnostics is not None:
+                state = view.frame_state()
+                if game.gc_controller is not None:
+                    game.gc_controller.frame(state == "playing")
+                if game.diagnostics is not None:
+                    game.diagnostics.end_frame(state)
+            self.render_jitter.mark()
+            clock.tick(60)  # 60 FPS
+        self._thread.join()
+
+        if game.recorder is not None:
+            game.recorder.end_match(game)
+        if game.diagnostics is not None:
+            print(game.diagnostics.report())
+        print(self.report())
+        pygame.quit()
+
+    def report(self):
+        """Return the jitter of both threads as a printable string"""
+        return "\n".join(
+            [
+                "Thread jitter",
+                self.simulation_jitter.report(),
+                self.render_jitter.report(),
+            ]
+        )
@@ -0,0 +1,106 @@
+"""FastForward must leave a game exactly where tick-by-tick Game.update does"""
+
+import os
+import random
+import sys
+
+import pytest
+
+# Run headless: no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the src package importable when run from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.fastforward import FastForward  # noqa: E402
+from src.game import Game  # noqa: E402
+
+TICKS = 3000
+MAX_SCORE = 5
+
+
+def new_game(seed, speed, difficulty):
+    """Return an AI-vs-AI game with a seeded, started match"""
+    game = Game(ai_vs_ai=True)
+    game.set_speed(speed)
+    game.set_ai_difficulty(difficulty)
+    game.max_score = MAX_SCORE
+    random.seed(seed)
+    game.ball.reset()
+    game.start_match()
+    return game
+
+
+def state(game):
+    ball = game.ball
+    return (
+        ball.rect.topleft,
+        ball.velocity_x,
+        ball.velocity_y,
+        game.player_paddle.rect.y,
+        game.ai_paddle.rect.y,
+        game.player_score,
+        game.ai_score,
+        game.game_over,
+        random.getstate(),
+    )
+
+
+@pytest.mark.parametrize("seed", (1, 2, 3))
+@pytest.mark.parametrize(
+    "speed, difficulty",
+    ((0.7, "easy"), (1.0, "medium"), (1.3, "hard"), (2.5, "medium"), (3.0, "hard")),
+)
+def test_matches_tick_by_tick(seed, speed, difficulty):
+    game = new_game(seed, speed, difficulty)
+    ticks = 0
+    while ticks < TICKS and not game.game_over:
+        game.update()
+        ticks += 1
+    expected = state(game)
+
+    game = new_game(seed, speed, difficulty)
+    forward = FastForward(game)
+    assert forward.advance(TICKS) == ticks
+    assert forward.ticks == ticks
+    assert state(game) == expected
+
+
+def test_advance_in_chunks():
+    game = new_game(4, 1.0, "medium")
+    for _ in range(TICKS):
+        game.update()
+    expected = state(game)
+
+    game = new_game(4, 1.0, "medium")
+    forward = FastForward(game)
+    for chunk in (1, 7, 250, 1000, TICKS - 1258):
+        forward.advance(chunk)
+    assert forward.ticks == TICKS
+    assert state(game) == expected
+
+
+@pytest.mark.parametrize("y, velocity_y", ((-16, 13), (593, -3)))
+def test_ball_caught_in_wall(y, velocity_y):
+    # A ball past the top or bottom wall flips its vertical velocity on every
+    # tick; each of those ticks is a wall hit that must not be skipped
+    def caught_game():
+        game = new_game(5, 1.0, "medium")
+        game.max_score = 1000
+        game.ball.rect.topleft = (300, y)
+        game.ball.velocity_x = 5
+        game.ball.velocity_y = velocity_y
+        hits = []
+        game.events.subscribe("wall_hit", lambda x, y: hits.append((x, y)))
+        return game, hits
+
+    game, hits = caught_game()
+    for _ in range(40):
+        game.update()
+    expected = state(game)
+
+    game, fast_hits = caught_game()
+    FastForward(game).advance(40)
+    assert state(game) == expected
+    assert fast_hits == hits